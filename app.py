@@ -1,31 +1,194 @@
-from flask import Flask, render_template, redirect, send_file, request, jsonify
-import csv, os
-from scraper import main as run_scraper  # import the main() from your scraper
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
+import os, json, hashlib, threading, atexit, functools
+# Only lightweight modules are imported here; the scraping stack (selenium, requests, bs4)
+# and pyarrow load on the first scrape or Parquet export so workers boot fast
+from browsers import BrowserPool
+from jobs import JobManager
+from storage import DEFAULT_DB_PATH, EXPORT_FIELDS, ProjectStore
+from exports import ExportError, export_stream, gzip_stream
+from metrics import REGISTRY
 
 app = Flask(__name__)
 
+store = ProjectStore(DEFAULT_DB_PATH)
+
+
+class StoreDataCache:
+    """Keep every stored project in memory until the store is written to
+
+    The store's version counter is bumped by each write, so load() only
+    re-reads the rows after a scrape has upserted something. version
+    identifies the loaded contents and is used to build ETags.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.lock = threading.Lock()
+        self.loaded_version = None
+        self.rows = []
+
+    def load(self):
+        """Return (version, rows), re-reading the store only if it changed"""
+        current = self.store.version()
+        with self.lock:
+            if current != self.loaded_version:
+                self.rows = self.store.all_rows()
+                self.loaded_version = current
+            return f"v{current}", self.rows
+
+
+data_cache = StoreDataCache(store)
+
+def run_scraper(**params):
+    """Run scraper.main, importing the scraper on first use; errors propagate so the job is marked failed"""
+    from scraper import main
+    return main(raise_errors=True, **params)
+
+
+# Headless browsers kept warm across scrapes; recycled after BROWSER_MAX_PAGES pages or when too big
+browsers = BrowserPool(size=int(os.environ.get('BROWSER_POOL_SIZE', 1)),
+                       max_pages=int(os.environ.get('BROWSER_MAX_PAGES', 200)),
+                       max_memory_mb=int(os.environ.get('BROWSER_MAX_MEMORY_MB', 1024)))
+atexit.register(browsers.close)
+warm_started = threading.Event()
+warm_lock = threading.Lock()
+
+
+@app.before_request
+def warm_browser_pool():
+    """Start the pool's browsers in the background on this process's first request
+
+    Doing it on first request rather than at import means it happens in
+    whichever process serves requests (a gunicorn worker, the reloader's
+    child), and not in tools that only import the app. WARM_BROWSERS=0
+    turns it off.
+    """
+    if warm_started.is_set() or os.environ.get('WARM_BROWSERS', '1') == '0':
+        return
+    with warm_lock:
+        if warm_started.is_set():
+            return
+        warm_started.set()
+    threading.Thread(target=browsers.warm, daemon=True).start()
+
+# Scrapes run in the background; only one runs at a time and repeat clicks join it
+jobs = JobManager(functools.partial(run_scraper, browser_pool=browsers), max_workers=1)
+
 @app.route('/')
 def index():
     return render_template('index.html', data=None)
 
 @app.route('/scrape', methods=['POST'])
 def scrape():
-    run_scraper()  # calls scraper.py main function
-    return jsonify({'status': 'done'})
+    job, created = jobs.submit()
+    return jsonify({'job_id': job.id, 'status': job.status, 'created': created}), 202
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'unknown job'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>/events')
+def job_events(job_id):
+    """Server-Sent Events stream of a job's status changes and scraped projects"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'unknown job'}), 404
+    try:
+        last_id = int(request.headers.get('Last-Event-ID', 0))
+    except ValueError:
+        last_id = 0
+
+    def stream():
+        nonlocal last_id
+        while True:
+            events = job.events_after(last_id, timeout=15)
+            if not events:
+                if job.closed:
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            for event in events:
+                last_id = event['id']
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+    return Response(stream_with_context(stream()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/metrics')
+def metrics():
+    """Scraper counters and latency histograms in Prometheus text format"""
+    return Response(REGISTRY.render_prometheus(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/data')
 def data():
-    import csv
-    if os.path.exists('rera_projects.csv'):
-        with open('rera_projects.csv', newline='', encoding='utf-8') as f:
-            data = list(csv.DictReader(f))
-        return jsonify(data)
-    return jsonify([])
+    """Return scraped projects as JSON
+
+    Optional query parameters: limit and offset page through the rows
+    (the total is sent in X-Total-Count), and columns is a comma-separated
+    list of fields to return. promoter or gst restricts the result to
+    one promoter name or GST number using the store's indexes. Responses
+    carry an ETag, so an unchanged poll with If-None-Match gets a 304.
+    """
+    try:
+        offset = int(request.args.get('offset', 0))
+        limit = int(request.args['limit']) if 'limit' in request.args else None
+    except ValueError:
+        return jsonify({'error': 'limit and offset must be integers'}), 400
+    if offset < 0 or (limit is not None and limit < 0):
+        return jsonify({'error': 'limit and offset must not be negative'}), 400
+    columns = [c.strip() for c in request.args.get('columns', '').split(',') if c.strip()]
+
+    promoter = request.args.get('promoter')
+    gst = request.args.get('gst')
+
+    version, rows = data_cache.load()
+    if promoter is not None:
+        rows = store.by_promoter(promoter)
+    elif gst is not None:
+        rows = store.by_gst(gst)
+    query = f"{offset}:{limit}:{','.join(columns)}:{promoter}:{gst}"
+    etag = f"{version}-{hashlib.md5(query.encode('utf-8')).hexdigest()[:8]}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    page = rows[offset:] if limit is None else rows[offset:offset + limit]
+    if columns:
+        page = [{column: row.get(column, '') for column in columns} for row in page]
+
+    response = jsonify(page)
+    response.set_etag(etag)
+    response.headers['X-Total-Count'] = str(len(rows))
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 @app.route('/download')
 def download():
-    return send_file('rera_projects.csv', as_attachment=True)
+    """Stream stored projects as CSV (default), NDJSON or Parquet
+
+    format selects the file type; promoter and gst_prefix filter the
+    rows. Rows are read from the store in batches and written out as
+    they come, and text formats are gzipped when the client sends
+    Accept-Encoding: gzip.
+    """
+    fmt = request.args.get('format', 'csv')
+    rows = store.iter_rows(promoter=request.args.get('promoter'), gst_prefix=request.args.get('gst_prefix'))
+    try:
+        chunks, mimetype, extension = export_stream(rows, fmt, EXPORT_FIELDS)
+    except ExportError as e:
+        return jsonify({'error': str(e)}), 400
+
+    headers = {'Content-Disposition': f'attachment; filename=rera_projects.{extension}', 'Vary': 'Accept-Encoding'}
+    # Parquet pages are already compressed, so only the text formats are gzipped
+    if fmt != 'parquet' and request.accept_encodings['gzip']:
+        chunks = gzip_stream(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
 
 if __name__ == "__main__":
     app.run(debug=True)
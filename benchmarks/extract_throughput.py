@@ -0,0 +1,75 @@
+"""Measure field-extraction throughput over saved detail/promoter HTML
+
+Usage:
+    python benchmarks/extract_throughput.py [html_dir] [--repeat N]
+
+html_dir must contain details/<id>.html and optionally promoter/<id>.html
+(the layout of benchmarks/fixtures). Every available parser configuration
+is timed over the same pages and reported in pages/sec.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractor import DEFAULT_PARSER, ProjectExtractor  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_pages(html_dir):
+    """Return a list of (detail_html, promoter_html or None) pairs from html_dir"""
+    pages = []
+    details_dir = os.path.join(html_dir, 'details')
+    for filename in sorted(os.listdir(details_dir)):
+        if not filename.endswith('.html'):
+            continue
+        with open(os.path.join(details_dir, filename), encoding='utf-8') as f:
+            detail_html = f.read()
+        promoter_path = os.path.join(html_dir, 'promoter', filename)
+        promoter_html = None
+        if os.path.exists(promoter_path):
+            with open(promoter_path, encoding='utf-8') as f:
+                promoter_html = f.read()
+        pages.append((detail_html, promoter_html))
+    return pages
+
+
+def run(extractor, pages, repeat):
+    """Extract every page repeat times and return pages per second"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for detail_html, promoter_html in pages:
+            extractor.extract(detail_html, promoter_html)
+    elapsed = time.perf_counter() - start
+    return len(pages) * repeat / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('html_dir', nargs='?', default=FIXTURES_DIR)
+    parser.add_argument('--repeat', type=int, default=200, help="passes over the page set")
+    args = parser.parse_args()
+
+    pages = load_pages(args.html_dir)
+    if not pages:
+        print(f"No pages found under {args.html_dir}/details")
+        return 1
+
+    configs = [('html.parser', False), ('html.parser', True)]
+    if DEFAULT_PARSER == 'lxml':
+        configs += [('lxml', False), ('lxml', True)]
+
+    print(f"{len(pages)} pages x {args.repeat} passes")
+    for parser_name, panels_only in configs:
+        extractor = ProjectExtractor(parser=parser_name, panels_only=panels_only, verbose=False)
+        rate = run(extractor, pages, args.repeat)
+        label = f"{parser_name}{' (tab panels only)' if panels_only else ''}"
+        print(f"  {label:<32} {rate:10.1f} pages/sec")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
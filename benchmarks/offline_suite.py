@@ -0,0 +1,163 @@
+"""Offline scraper benchmark against a local stand-in of the RERA portal
+
+Serves the recorded pages in benchmarks/fixtures and times each phase of
+the scraper against them:
+
+    links_http        link discovery from the fetched listing HTML
+    links             link discovery from the rendered listing (needs Chrome)
+    details_http      scrape_project_details with the http backend
+    details_selenium  scrape_project_details in Chrome (needs Chrome)
+    extract           ProjectExtractor over the recorded HTML
+
+Each phase reports p50/p90/p99 latency, pages/sec, and the process's peak
+RSS. --save-baseline writes the results to a JSON file, and --baseline
+compares against one and exits non-zero when a phase is slower than the
+baseline by more than --tolerance.
+
+Usage:
+    python benchmarks/offline_suite.py [--repeat N] [--no-browser]
+        [--save-baseline FILE | --baseline FILE [--tolerance 0.25]]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extract_throughput import load_pages  # noqa: E402
+from standin import FIXTURES_DIR, StandInSite  # noqa: E402
+from extractor import ProjectExtractor  # noqa: E402
+from politeness import PolitenessScheduler  # noqa: E402
+from scraper import RERAOdishaScraper  # noqa: E402
+
+# Phases compared against the baseline; latency regressions beyond tolerance fail the run
+COMPARED_METRICS = ('p50', 'p90')
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def timed(func, items, repeat):
+    """Call func on every item repeat times; return (latencies, pages/sec)"""
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            t0 = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return latencies, len(latencies) / elapsed if elapsed else 0.0
+
+
+def summarize(latencies, rate):
+    return {
+        'pages': len(latencies),
+        'p50': round(percentile(latencies, 50), 6),
+        'p90': round(percentile(latencies, 90), 6),
+        'p99': round(percentile(latencies, 99), 6),
+        'pages_per_sec': round(rate, 2),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def run_phases(site, repeat, use_browser):
+    results = {}
+    detail_urls = site.detail_urls()
+
+    # Scraper output is per-field chatter; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Time the scraper itself, not the politeness pacing
+        unthrottled = PolitenessScheduler(rate=1e6, max_rate=1e6, burst=1e6, concurrency=64, max_concurrency=64)
+        scraper = RERAOdishaScraper(backend='http', listing_url=site.listing_url, scheduler=unthrottled)
+        try:
+            latencies, rate = timed(lambda _: scraper.discover_links_http(len(detail_urls)), [None], repeat)
+            results['links_http'] = summarize(latencies, rate * len(detail_urls))
+
+            latencies, rate = timed(scraper.scrape_project_details_http, detail_urls, repeat)
+            results['details_http'] = summarize(latencies, rate)
+
+            pages = load_pages(FIXTURES_DIR)
+            extractor = ProjectExtractor(verbose=False)
+            latencies, rate = timed(lambda page: extractor.extract(*page), pages, repeat)
+            results['extract'] = summarize(latencies, rate)
+
+            if use_browser:
+                scraper.headless = True
+                latencies, rate = timed(lambda _: scraper.discover_links_dom(len(detail_urls)), [None], 1)
+                results['links'] = summarize(latencies, rate * len(detail_urls))
+                latencies, rate = timed(scraper.scrape_project_details_selenium, detail_urls, 1)
+                results['details_selenium'] = summarize(latencies, rate)
+        finally:
+            scraper.close()
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages for phases slower than baseline by more than tolerance"""
+    regressions = []
+    for phase, current in results.items():
+        previous = baseline.get(phase)
+        if not previous:
+            continue
+        for metric in COMPARED_METRICS:
+            if previous[metric] and current[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f"{phase} {metric}: {current[metric]:.4f}s vs baseline {previous[metric]:.4f}s")
+        if previous['pages_per_sec'] and current['pages_per_sec'] < previous['pages_per_sec'] * (1 - tolerance):
+            regressions.append(f"{phase} pages/sec: {current['pages_per_sec']} vs baseline {previous['pages_per_sec']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20, help="passes over the recorded pages")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds the stand-in adds to every response")
+    parser.add_argument('--no-browser', action='store_true', help="skip the phases that need Chrome")
+    parser.add_argument('--save-baseline', metavar='FILE', help="write results to FILE")
+    parser.add_argument('--baseline', metavar='FILE', help="compare results against FILE")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    with StandInSite(latency=args.latency) as site:
+        results = run_phases(site, args.repeat, not args.no_browser)
+
+    print(f"{'phase':<18}{'pages':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'pages/s':>10}{'rss MB':>9}")
+    for phase, r in results.items():
+        print(f"{phase:<18}{r['pages']:>7}{r['p50'] * 1000:>10.2f}{r['p90'] * 1000:>10.2f}"
+              f"{r['p99'] * 1000:>10.2f}{r['pages_per_sec']:>10.1f}{r['peak_rss_mb']:>9.1f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("Performance regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Local stand-in for the Odisha RERA portal, serving recorded pages
+
+Routes (mirroring the live site):
+    /projects/project-list   -> fixtures/project-list.html
+    ...?page=N               -> fixtures/project-list-N.html (for N > 1)
+    /project-details/<id>    -> fixtures/details/<id>.html
+    /promoter/<id>           -> fixtures/promoter/<id>.html
+
+latency adds a fixed delay to every response and error_rate makes that
+fraction of responses fail with 503, for exercising timeouts and retries.
+To imitate a portal that slows down under load, load_latency adds that
+many seconds per other request in flight, and requests beyond capacity
+concurrent ones get a 503.
+
+Usage:
+    python benchmarks/standin.py [--port 8000] [--latency 0.2] [--error-rate 0.1]
+        [--load-latency 0.1] [--capacity 4]
+"""
+import argparse
+import os
+from urllib.parse import parse_qs
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+def listing_page(query):
+    page = parse_qs(query).get('page', ['1'])[0]
+    return 'project-list.html' if page == '1' else f'project-list-{page}.html'
+
+
+ROUTES = [
+    ('/projects/project-list', lambda rest, query: listing_page(query)),
+    ('/project-details/', lambda rest, query: os.path.join('details', rest + '.html')),
+    ('/promoter/', lambda rest, query: os.path.join('promoter', rest + '.html')),
+]
+
+
+def make_handler(fixtures_dir, latency, error_rate, load_latency=0.0, capacity=None):
+    lock = threading.Lock()
+    in_flight = [0]
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            with lock:
+                in_flight[0] += 1
+                concurrent = in_flight[0]
+            try:
+                if capacity and concurrent > capacity:
+                    return self.send_page(503, b'Service Unavailable')
+                delay = latency + load_latency * (concurrent - 1)
+                if delay:
+                    time.sleep(delay)
+                self.serve_fixture()
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        def serve_fixture(self):
+            path, _, query = self.path.partition('?')
+            path = path.rstrip('/')
+            if error_rate and random.random() < error_rate:
+                return self.send_page(503, b'Service Unavailable')
+            for prefix, resolve in ROUTES:
+                if path == prefix or (prefix.endswith('/') and path.startswith(prefix)):
+                    relative = resolve(path[len(prefix):], query)
+                    full_path = os.path.normpath(os.path.join(fixtures_dir, relative))
+                    if full_path.startswith(os.path.normpath(fixtures_dir)) and os.path.isfile(full_path):
+                        with open(full_path, 'rb') as f:
+                            return self.send_page(200, f.read())
+            self.send_page(404, b'Not Found')
+
+        def send_page(self, status, body):
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+class StandInSite:
+    """Serve the fixture pages from a background thread
+
+    The port is bound on construction (port=0 picks a free one) and
+    requests are served while the context manager is active.
+    """
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR, port=0, latency=0.0, error_rate=0.0, load_latency=0.0,
+                 capacity=None):
+        self.fixtures_dir = fixtures_dir
+        handler = make_handler(fixtures_dir, latency, error_rate, load_latency, capacity)
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.listing_url = self.base_url + '/projects/project-list'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def detail_urls(self):
+        """URLs of every recorded detail page"""
+        details_dir = os.path.join(self.fixtures_dir, 'details')
+        return [f"{self.base_url}/project-details/{name[:-len('.html')]}"
+                for name in sorted(os.listdir(details_dir)) if name.endswith('.html')]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded RERA pages locally")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of responses that fail with 503")
+    parser.add_argument('--load-latency', type=float, default=0.0,
+                        help="seconds added per other request in flight")
+    parser.add_argument('--capacity', type=int, help="concurrent requests served before answering 503")
+    args = parser.parse_args()
+
+    with StandInSite(args.fixtures, args.port, args.latency, args.error_rate, args.load_latency,
+                     args.capacity) as site:
+        print(f"Serving {args.fixtures} at {site.listing_url}")
+        try:
+            site.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
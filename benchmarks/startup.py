@@ -0,0 +1,118 @@
+"""Cold-start benchmark for the Flask app
+
+Imports app.py in fresh interpreters under `python -X importtime` and
+reports the median total import time, the wall time of the whole
+process, and the slowest modules. The run fails (exit status 1) when:
+
+    - a module that should load lazily (selenium, pandas, bs4, ...)
+      is imported at startup,
+    - --budget-ms is given and the import takes longer than that, or
+    - --baseline is given and the import or process time is slower
+      than the baseline by more than --tolerance.
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--top 10] [--budget-ms 400]
+        [--save-baseline FILE | --baseline FILE [--tolerance 0.25]]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed by the scrape and Parquet export paths; none of these may load with the app
+LAZY_MODULES = ('selenium', 'webdriver_manager', 'pandas', 'numpy', 'bs4', 'lxml', 'requests', 'pyarrow')
+
+COMPARED_METRICS = ('import_ms', 'process_ms')
+
+
+def parse_importtime(stderr):
+    """Return {module: (self_us, cumulative_us)} for the top-level entry of each module"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return modules
+
+
+def import_app_once(workdir):
+    """Import app in a new interpreter; returns (importtime table, process wall time in seconds)"""
+    code = f"import sys; sys.path.insert(0, {REPO_DIR!r}); import app"
+    start = time.perf_counter()
+    # Run from a scratch directory so the app's SQLite file is not created in the repo
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=workdir,
+                            capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"importing app failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr), elapsed
+
+
+def measure(runs):
+    import_times, process_times = [], []
+    modules = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        # The first run compiles .pyc files; it is not counted
+        import_app_once(workdir)
+        for _ in range(runs):
+            modules, elapsed = import_app_once(workdir)
+            import_times.append(modules['app'][1] / 1000)
+            process_times.append(elapsed * 1000)
+    return {
+        'import_ms': round(statistics.median(import_times), 1),
+        'process_ms': round(statistics.median(process_times), 1),
+    }, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters to time")
+    parser.add_argument('--top', type=int, default=10, help="slowest modules to list")
+    parser.add_argument('--budget-ms', type=float, help="fail if importing app takes longer than this")
+    parser.add_argument('--save-baseline', metavar='FILE', help="write results to FILE")
+    parser.add_argument('--baseline', metavar='FILE', help="compare results against FILE")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results, modules = measure(args.runs)
+    print(f"import app: {results['import_ms']:.1f} ms, process: {results['process_ms']:.1f} ms "
+          f"(median of {args.runs})")
+    top_level = {name: times for name, times in modules.items() if '.' not in name and name != 'app'}
+    print("Slowest top-level imports:")
+    for name, (_, cumulative_us) in sorted(top_level.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"  {name:<24}{cumulative_us / 1000:>8.1f} ms")
+
+    failures = [f"{name} is imported at startup" for name in LAZY_MODULES if name in modules]
+    if args.budget_ms is not None and results['import_ms'] > args.budget_ms:
+        failures.append(f"import took {results['import_ms']:.1f} ms, budget is {args.budget_ms:.0f} ms")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        for metric in COMPARED_METRICS:
+            if baseline.get(metric) and results[metric] > baseline[metric] * (1 + args.tolerance):
+                failures.append(f"{metric}: {results[metric]:.1f} ms vs baseline {baseline[metric]:.1f} ms")
+
+    if failures:
+        print("Startup regressions:")
+        for message in failures:
+            print(f"  {message}")
+        return 1
+    print("Startup OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+import os
+import queue
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+
+from metrics import REGISTRY
+
+# Requests Chrome never needs to make for scraping: images, fonts, stylesheets and analytics
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+    '*hotjar.com*', '*clarity.ms*',
+]
+
+# How long acquire() waits for another scraper to hand a browser back
+DEFAULT_ACQUIRE_TIMEOUT = 300
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path():
+    """Locate chromedriver once per process
+
+    CHROMEDRIVER_PATH or a chromedriver on PATH is used as is; otherwise
+    webdriver-manager downloads (or finds its cached copy of) a matching
+    driver. Either way the lookup, which may hit the network, only runs
+    for the first browser.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            with REGISTRY.span('driver_install'):
+                _driver_path = (os.environ.get('CHROMEDRIVER_PATH') or shutil.which('chromedriver') or
+                                ChromeDriverManager().install())
+        return _driver_path
+
+
+def chrome_options(headless=True, block_resources=True):
+    from selenium import webdriver
+    options = webdriver.ChromeOptions()
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--window-size=1920,1080')
+    if block_resources:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+    if headless:
+        options.add_argument('--headless=new')
+    return options
+
+
+def new_driver(headless=True, block_resources=True):
+    """Start Chrome with the cached chromedriver, blocking static assets unless block_resources is False"""
+    # Selenium is imported here so that holding a BrowserPool does not load it
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    service = Service(resolve_driver_path())
+    with REGISTRY.span('driver_start'):
+        driver = webdriver.Chrome(service=service, options=chrome_options(headless, block_resources))
+        if not headless:
+            driver.maximize_window()
+        if block_resources:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    REGISTRY.inc('scraper_browsers_started_total')
+    return driver
+
+
+def _process_tree(root_pid):
+    """root_pid and all of its descendants, read from /proc"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; ppid is the second field after it
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    pids, pending = [], [root_pid]
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    return pids
+
+
+def browser_memory_mb(driver):
+    """Resident memory of chromedriver and its Chrome processes in MB
+
+    Falls back to the page's JS heap size where /proc is not available.
+    """
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process is not None and os.path.isdir('/proc'):
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        total = 0
+        for pid in _process_tree(process.pid):
+            try:
+                with open(f'/proc/{pid}/statm') as f:
+                    total += int(f.read().split()[1]) * page_size
+            except (OSError, IndexError, ValueError):
+                continue
+        return total / (1024 * 1024)
+    driver.execute_cdp_cmd('Performance.enable', {})
+    metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+    return next((m['value'] for m in metrics if m['name'] == 'JSHeapTotalSize'), 0) / (1024 * 1024)
+
+
+class PooledBrowser:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.started_at = time.time()
+
+
+class BrowserPool:
+    """Long-lived headless Chrome instances handed out to scrapers
+
+    Browsers are started on demand up to `size` and returned to the pool
+    after each scrape instead of being quit. A browser that has loaded
+    max_pages pages, or whose processes use more than max_memory_mb, is
+    due for recycling: renew() swaps it for a fresh one in the middle of
+    a long lease (memory is sampled every memory_check_every pages), and
+    release() quits it instead of putting it back. warm() starts
+    browsers ahead of the first scrape.
+    """
+
+    def __init__(self, size=2, headless=True, block_resources=True, max_pages=200, max_memory_mb=1024,
+                 memory_check_every=10):
+        self.size = size
+        self.headless = headless
+        self.block_resources = block_resources
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.memory_check_every = memory_check_every
+        self.idle = queue.LifoQueue()
+        self.lock = threading.Lock()
+        self.started = 0
+        self.closed = False
+
+    def _start(self):
+        try:
+            return PooledBrowser(new_driver(self.headless, self.block_resources))
+        except Exception:
+            with self.lock:
+                self.started -= 1
+            raise
+
+    def acquire(self, timeout=DEFAULT_ACQUIRE_TIMEOUT):
+        """Return an idle browser, starting one if fewer than size are running
+
+        Raises RuntimeError if all size browsers stay leased for timeout
+        seconds (None waits forever).
+        """
+        try:
+            return self._acquire(timeout)
+        except queue.Empty:
+            raise RuntimeError(f"no browser was free in the pool of {self.size} after {timeout}s; "
+                               f"every browser is leased (is the pool smaller than the number of workers?)")
+
+    def _acquire(self, timeout):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("browser pool is closed")
+            can_start = self.started < self.size
+            if can_start:
+                self.started += 1
+        if can_start:
+            return self._start()
+        return self.idle.get(timeout=timeout)
+
+    def recycle_reason(self, browser, check_memory=True):
+        """Why browser should be replaced ('pages', 'memory', 'error'), or None if it is fine"""
+        if browser.pages >= self.max_pages:
+            return 'pages'
+        if not check_memory:
+            return None
+        try:
+            if browser_memory_mb(browser.driver) > self.max_memory_mb:
+                return 'memory'
+        except Exception as e:
+            print(f"Pooled browser is unusable: {e}")
+            return 'error'
+        return None
+
+    def _retire(self, browser, reason):
+        print(f"Recycling browser after {browser.pages} pages ({reason})")
+        REGISTRY.inc('scraper_browsers_recycled_total', reason=reason)
+        self._quit(browser)
+
+    def renew(self, browser):
+        """Return browser, or a replacement if it is due for recycling, while keeping the lease"""
+        check_memory = bool(self.memory_check_every) and browser.pages % self.memory_check_every == 0
+        reason = self.recycle_reason(browser, check_memory)
+        if reason is None:
+            return browser
+        self._retire(browser, reason)
+        return self.acquire()
+
+    def release(self, browser, pages=0):
+        """Give a browser back, quitting it if it is due for recycling"""
+        browser.pages += pages
+        reason = 'closed' if self.closed else self.recycle_reason(browser)
+        if reason is None:
+            try:
+                # Drop the previous scrape's page so its memory can be reclaimed while idle
+                browser.driver.get('about:blank')
+            except Exception as e:
+                print(f"Pooled browser is unusable: {e}")
+                reason = 'error'
+        if reason is None:
+            self.idle.put(browser)
+            return
+        self._retire(browser, reason)
+
+    def _quit(self, browser):
+        try:
+            browser.driver.quit()
+        except Exception as e:
+            print(f"Error closing pooled browser: {e}")
+        with self.lock:
+            self.started -= 1
+
+    @contextmanager
+    def lease(self):
+        """Borrow a browser for the duration of a with block"""
+        browser = self.acquire()
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def warm(self, count=None):
+        """Start browsers until count (default size) are idle"""
+        count = self.size if count is None else count
+        browsers = []
+        try:
+            for _ in range(count):
+                browsers.append(self._acquire(timeout=0))
+        except queue.Empty:
+            pass
+        except Exception as e:
+            print(f"Could not warm browser pool: {e}")
+        for browser in browsers:
+            self.idle.put(browser)
+        return len(browsers)
+
+    def close(self):
+        self.closed = True
+        while True:
+            try:
+                browser = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(browser)
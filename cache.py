@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+DEFAULT_CACHE_DIR = '.html_cache'
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_SAVE_EVERY = 200
+
+
+def content_hash(html):
+    """Return the sha256 hex digest of an HTML string"""
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+
+class SnapshotCache:
+    """On-disk cache of raw detail/Promoter HTML and the row extracted from it
+
+    Pages are stored once per content hash under blobs/, and index.json
+    maps each project URL to its current hashes, the extracted row and
+    fetch/access times. Blobs are reference-counted; one that no entry
+    points at any more is deleted once an index without it has been
+    written, so index.json never names a missing blob.
+
+    Changes are kept in memory and the index is written by save(), or
+    after every save_every puts, so a put only costs the blobs it
+    writes. Each time the index is written, entries older than ttl
+    seconds are dropped, and so are the least recently used ones beyond
+    max_entries. Loading the cache deletes blobs left unreferenced by a
+    run that stopped before saving, and skips index entries whose blobs
+    are gone.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES,
+                 save_every=DEFAULT_SAVE_EVERY):
+        self.root = root
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.blob_dir = os.path.join(root, 'blobs')
+        self.index_path = os.path.join(root, 'index.json')
+        self.save_every = save_every
+        self.lock = threading.Lock()
+        # Only one thread writes index.json at a time; the main lock is not held while it does
+        self.save_lock = threading.Lock()
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.index = self._load_index()
+        self.dirty = False
+        self._drop_missing()
+        self.refs = Counter(digest for entry in self.index.values()
+                            for digest in (entry['detail'], entry['promoter']) if digest)
+        # Blobs no entry refers to, deleted by the next save() once the index no longer names them
+        self.unreferenced = set()
+        self._remove_orphans()
+        self.unsaved_puts = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable cache index {self.index_path}: {e}")
+            return {}
+
+    def _drop_missing(self):
+        """Forget entries whose blobs were deleted without the index being rewritten"""
+        missing = [url for url, entry in self.index.items()
+                   if any(digest and not os.path.exists(self._blob_path(digest))
+                          for digest in (entry['detail'], entry['promoter']))]
+        for url in missing:
+            del self.index[url]
+        if missing:
+            print(f"Dropping {len(missing)} cache entries whose pages are missing")
+            self.dirty = True
+
+    def _remove_orphans(self):
+        """Delete blobs and temp files written by a run that never saved an index naming them"""
+        for name in os.listdir(self.blob_dir):
+            if name.endswith('.html') and name[:-len('.html')] in self.refs:
+                continue
+            try:
+                os.remove(os.path.join(self.blob_dir, name))
+            except FileNotFoundError:
+                pass
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest + '.html')
+
+    def _write_blob(self, digest, html):
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            # Write under a per-thread name so a concurrent reader never sees half a file
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            os.replace(tmp_path, path)
+
+    def _add_refs(self, entry):
+        for digest in (entry['detail'], entry['promoter']):
+            if digest:
+                self.refs[digest] += 1
+
+    def _drop_refs(self, entry):
+        """Release an entry's blobs, queueing those no other entry uses for deletion (caller holds the lock)"""
+        for digest in (entry['detail'], entry['promoter']):
+            if not digest:
+                continue
+            self.refs[digest] -= 1
+            if self.refs[digest] <= 0:
+                del self.refs[digest]
+                self.unreferenced.add(digest)
+
+    def _read_blob(self, digest):
+        if digest is None:
+            return None
+        with open(self._blob_path(digest), encoding='utf-8') as f:
+            return f.read()
+
+    def _expired(self, entry, now):
+        return self.ttl is not None and now - entry['fetched_at'] > self.ttl
+
+    def lookup_row(self, url, detail_html, promoter_html=None):
+        """Return the cached row for url if both pages hash the same as last time, else None"""
+        with self.lock:
+            entry = self.index.get(url)
+            now = time.time()
+            if (entry is None or self._expired(entry, now) or
+                    entry['detail'] != content_hash(detail_html) or
+                    entry['promoter'] != (content_hash(promoter_html) if promoter_html is not None else None)):
+                self.misses += 1
+                return None
+            entry['accessed_at'] = now
+            self.dirty = True
+            self.hits += 1
+            return dict(entry['row'])
+
+    def put(self, url, detail_html, promoter_html, row):
+        """Store the pages for url and the row extracted from them"""
+        pages = {}
+        for html in (detail_html, promoter_html):
+            if html is not None:
+                digest = content_hash(html)
+                self._write_blob(digest, html)
+                pages[digest] = html
+        now = time.time()
+        entry = {
+            'detail': content_hash(detail_html) if detail_html is not None else None,
+            'promoter': content_hash(promoter_html) if promoter_html is not None else None,
+            'row': {key: value for key, value in row.items() if key != 'URL'},
+            'fetched_at': now,
+            'accessed_at': now,
+        }
+        with self.lock:
+            self._add_refs(entry)
+            previous = self.index.get(url)
+            self.index[url] = entry
+            if previous is not None:
+                self._drop_refs(previous)
+            # A save() may have deleted a blob that was unreferenced between our write and now
+            for digest, html in pages.items():
+                if not os.path.exists(self._blob_path(digest)):
+                    self._write_blob(digest, html)
+            self.dirty = True
+            self.unsaved_puts += 1
+            due = self.save_every and self.unsaved_puts >= self.save_every
+        if due:
+            self.save()
+
+    def _evict(self, now):
+        """Drop expired and least recently used entries, returning how many were removed"""
+        removed = [url for url, entry in self.index.items() if self._expired(entry, now)]
+        if self.max_entries is not None and len(self.index) - len(removed) > self.max_entries:
+            expired = set(removed)
+            by_access = sorted((url for url in self.index if url not in expired),
+                               key=lambda url: self.index[url]['accessed_at'])
+            removed += by_access[:len(by_access) - self.max_entries]
+        for url in removed:
+            self._drop_refs(self.index.pop(url))
+        return len(removed)
+
+    def evict(self):
+        """Apply TTL and LRU eviction now and persist the index"""
+        self.save()
+
+    def iter_snapshots(self):
+        """Yield (url, detail_html, promoter_html) for every live cached project"""
+        with self.lock:
+            now = time.time()
+            entries = [(url, dict(entry)) for url, entry in self.index.items() if not self._expired(entry, now)]
+        for url, entry in entries:
+            yield url, self._read_blob(entry['detail']), self._read_blob(entry['promoter'])
+
+    def save(self):
+        """Apply eviction and persist the index, including access times updated by cache hits"""
+        with self.save_lock:
+            with self.lock:
+                if self._evict(time.time()):
+                    self.dirty = True
+                if not self.dirty:
+                    return
+                # Entries are replaced rather than rebuilt on put, so a shallow copy is a stable snapshot
+                snapshot = dict(self.index)
+                unreferenced, self.unreferenced = self.unreferenced, set()
+                self.dirty = False
+                self.unsaved_puts = 0
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.index_path)
+            # Only now does no index on disk point at these blobs
+            with self.lock:
+                for digest in unreferenced:
+                    if digest in self.refs:
+                        continue
+                    try:
+                        os.remove(self._blob_path(digest))
+                    except FileNotFoundError:
+                        pass
+
+    def update_row(self, url, row):
+        """Replace the stored row for url without touching its pages"""
+        with self.lock:
+            if url in self.index:
+                self.index[url] = dict(self.index[url], row={key: value for key, value in row.items() if key != 'URL'})
+                self.dirty = True
+
+    def __len__(self):
+        return len(self.index)
@@ -0,0 +1,245 @@
+import json
+import os
+import threading
+import time
+
+from cache import DEFAULT_TTL, SnapshotCache
+from metrics import REGISTRY
+from politeness import PolitenessScheduler
+from scraper import BACKENDS, LINK_DISCOVERY_MODES, RERAOdishaScraper, ScraperPool
+from storage import DEFAULT_DB_PATH, ProjectStore
+
+DEFAULT_CHECKPOINT = 'crawl_checkpoint.json'
+# Within a listing page the checkpoint is rewritten after this many projects or seconds
+DEFAULT_CHECKPOINT_EVERY = 50
+DEFAULT_CHECKPOINT_INTERVAL = 30.0
+
+
+class RegistryCrawler:
+    """Walk every listing page of the registry and store each project once
+
+    The frontier holds one (district, page) entry per district still being
+    paged through (a single None entry when no district filter is used).
+    A district is finished when its next page has no links, when a page
+    lists exactly the links of the page before it (the site ignored the
+    page parameter), or after max_pages pages. A page whose projects were
+    all crawled already (e.g. the page in progress when a crawl was
+    interrupted) is skipped over. Detail pages of each listing page are
+    scraped by a ScraperPool of `workers` browsers, and a project whose
+    RERA number was already stored under another URL is skipped as a
+    duplicate.
+
+    Progress is written to checkpoint_path after every listing page, and
+    within a page after every checkpoint_every projects or
+    checkpoint_interval seconds, so an interrupted crawl picks up where
+    it stopped and re-scrapes at most the projects since the last save.
+    """
+
+    def __init__(self, scraper, store, workers=4, checkpoint_path=DEFAULT_CHECKPOINT, max_pages=None,
+                 districts=None, headless=True, checkpoint_every=DEFAULT_CHECKPOINT_EVERY,
+                 checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+        self.scraper = scraper
+        self.store = store
+        self.workers = workers
+        self.checkpoint_path = checkpoint_path
+        self.max_pages = max_pages
+        self.districts = districts or [None]
+        self.headless = headless
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.unsaved = 0
+        self.last_saved = time.monotonic()
+        self.lock = threading.Lock()
+        # Serialises checkpoint writes from the pool's worker threads
+        self.save_lock = threading.Lock()
+        self.frontier = []
+        self.seen_urls = set()
+        self.seen_rera = set()
+        self.stored = 0
+        self.duplicates = 0
+        self.failed = 0
+
+    def load_checkpoint(self):
+        """Restore a previous crawl's progress; returns False if there is none"""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return False
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            state = json.load(f)
+        self.frontier = [tuple(entry) for entry in state['frontier']]
+        self.seen_urls = set(state['seen_urls'])
+        self.seen_rera = set(state['seen_rera'])
+        self.stored = state.get('stored', 0)
+        self.duplicates = state.get('duplicates', 0)
+        print(f"Resuming crawl from {self.checkpoint_path}: {len(self.seen_urls)} projects done, "
+              f"{len(self.frontier)} district(s) left")
+        return True
+
+    def save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        with self.save_lock:
+            with self.lock:
+                state = {
+                    'frontier': [list(entry) for entry in self.frontier],
+                    'seen_urls': list(self.seen_urls),
+                    'seen_rera': list(self.seen_rera),
+                    'stored': self.stored,
+                    'duplicates': self.duplicates,
+                }
+                self.unsaved = 0
+                self.last_saved = time.monotonic()
+            tmp_path = self.checkpoint_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.checkpoint_path)
+
+    def project_done(self):
+        """Count a finished project, saving the checkpoint if enough projects or time have passed"""
+        with self.lock:
+            self.unsaved += 1
+            due = (self.unsaved >= self.checkpoint_every or
+                   time.monotonic() - self.last_saved >= self.checkpoint_interval)
+            if due:
+                # Reset here so the other workers do not all start a save at once
+                self.unsaved = 0
+                self.last_saved = time.monotonic()
+        if due:
+            self.save_checkpoint()
+
+    def record(self, project_data):
+        """Store one scraped project unless its RERA number was already seen"""
+        rera_no = (project_data.get('Rera Regd. No') or '').strip()
+        with self.lock:
+            if not rera_no:
+                # Leave the URL unseen so a resumed crawl tries it again
+                self.failed += 1
+                return False
+            self.seen_urls.add(project_data['URL'])
+            if rera_no in self.seen_rera:
+                self.duplicates += 1
+                REGISTRY.inc('scraper_duplicates_total')
+                print(f"Skipping duplicate of {rera_no}: {project_data['URL']}")
+                return False
+            self.seen_rera.add(rera_no)
+        if self.store.upsert(project_data):
+            with self.lock:
+                self.stored += 1
+        return True
+
+    def crawl_page(self, pool, district, page, on_project=None):
+        """Scrape the new projects on one listing page; returns the page's links (empty past the last page)"""
+        label = f"{district} page {page}" if district else f"page {page}"
+        print(f"\n=== Listing {label} ===")
+        with REGISTRY.span('crawl_page', detail=label):
+            project_links = list(dict.fromkeys(self.scraper.get_listing_page_links(page, district)))
+        new_links = [url for url in project_links if url not in self.seen_urls]
+        if not new_links:
+            if project_links:
+                print(f"All {len(project_links)} projects on {label} already crawled")
+            return project_links
+
+        def record_project(index, total, project_data):
+            self.record(project_data)
+            self.project_done()
+            if on_project:
+                on_project(index, total, project_data)
+
+        if self.scraper.browser_pool is not None:
+            # The pool's workers lease from the same browser pool; hand the listing's browser back first
+            self.scraper.release_browser()
+        pool.map(new_links, on_project=record_project)
+        return project_links
+
+    def run(self, resume=True, on_project=None):
+        """Crawl until the frontier is empty; returns the number of projects stored"""
+        if not (resume and self.load_checkpoint()):
+            self.frontier = [(district, 1) for district in self.districts]
+
+        with ScraperPool(workers=self.workers, headless=self.headless, backend=self.scraper.backend,
+                         cache=self.scraper.cache, scheduler=self.scraper.scheduler,
+                         browser_pool=self.scraper.browser_pool) as pool:
+            previous_links = {}
+            while self.frontier:
+                district, page = self.frontier[0]
+                project_links = self.crawl_page(pool, district, page, on_project)
+                if not project_links:
+                    print(f"No projects on page {page}, done with {district or 'the listing'}")
+                    done = True
+                elif project_links == previous_links.get(district):
+                    print(f"Page {page} repeats page {page - 1}, done with {district or 'the listing'}")
+                    done = True
+                else:
+                    done = self.max_pages is not None and page >= self.max_pages
+                previous_links[district] = project_links
+                with self.lock:
+                    if done:
+                        self.frontier.pop(0)
+                    else:
+                        self.frontier[0] = (district, page + 1)
+                self.save_checkpoint()
+
+        print(f"Politeness scheduler: {self.scraper.scheduler.stats()}")
+        print(f"\nCrawl finished: {self.stored} stored, {self.duplicates} duplicates skipped, "
+              f"{self.failed} failed")
+        return self.stored
+
+
+def main(workers=4, backend='selenium', link_discovery='auto', districts=None, max_pages=None,
+         checkpoint_path=DEFAULT_CHECKPOINT, fresh=False, db_path=DEFAULT_DB_PATH, cache_dir=None,
+         cache_ttl=DEFAULT_TTL, report_file='crawl_report.json', listing_url=None, max_rate=5.0):
+    """Crawl the whole registry into the SQLite store at db_path
+
+    districts is a list of district names to filter the listing by, or
+    ['all'] for every district offered by the listing's dropdown. With
+    fresh=True an existing checkpoint is ignored and the crawl restarts.
+    """
+    run_start = REGISTRY.snapshot()
+    cache = SnapshotCache(cache_dir, ttl=cache_ttl) if cache_dir else None
+    kwargs = {'listing_url': listing_url} if listing_url else {}
+    scheduler = PolitenessScheduler(max_rate=max_rate, max_concurrency=workers)
+    scraper = RERAOdishaScraper(headless=True, backend=backend, cache=cache, link_discovery=link_discovery,
+                                scheduler=scheduler, **kwargs)
+    store = ProjectStore(db_path)
+    try:
+        if districts == ['all']:
+            districts = scraper.list_districts()
+            print(f"Crawling {len(districts)} districts")
+        crawler = RegistryCrawler(scraper, store, workers=workers, checkpoint_path=checkpoint_path,
+                                  max_pages=max_pages, districts=districts)
+        crawler.run(resume=not fresh)
+        print(f"{store.count()} projects stored in {db_path}")
+    finally:
+        scraper.close()
+        store.close()
+        if cache is not None:
+            cache.save()
+        if report_file:
+            REGISTRY.write_report(report_file, since=run_start)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Crawl every project in the Odisha RERA registry")
+    parser.add_argument('--workers', type=int, default=4, help="maximum browsers scraping detail pages at once")
+    parser.add_argument('--backend', choices=BACKENDS, default='selenium',
+                        help="fetch pages in Chrome or over plain HTTP with Selenium fallback")
+    parser.add_argument('--link-discovery', choices=LINK_DISCOVERY_MODES, default='auto',
+                        help="how project URLs are read from each listing page")
+    parser.add_argument('--districts', help="comma-separated districts to filter by, or 'all'")
+    parser.add_argument('--max-pages', type=int, help="stop after this many listing pages per district")
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help="JSON file crawl progress is saved to")
+    parser.add_argument('--fresh', action='store_true', help="ignore an existing checkpoint and start over")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite file projects are stored in")
+    parser.add_argument('--cache-dir', help="keep raw pages here and skip extraction for unchanged projects")
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_TTL, help="seconds before a cached page expires")
+    parser.add_argument('--report', default='crawl_report.json', help="JSON file for the crawl's timing report")
+    parser.add_argument('--max-rate', type=float, default=5.0, help="upper bound on requests per second to the site")
+    parser.add_argument('--listing-url', help="listing page to start from (defaults to the live portal)")
+    args = parser.parse_args()
+
+    districts = [name.strip() for name in args.districts.split(',')] if args.districts else None
+    main(workers=args.workers, backend=args.backend, link_discovery=args.link_discovery, districts=districts,
+         max_pages=args.max_pages, checkpoint_path=args.checkpoint, fresh=args.fresh, db_path=args.db,
+         cache_dir=args.cache_dir, cache_ttl=args.cache_ttl, report_file=args.report,
+         listing_url=args.listing_url, max_rate=args.max_rate)
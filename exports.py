@@ -0,0 +1,136 @@
+import csv
+import importlib.util
+import io
+import json
+import zlib
+
+# pyarrow takes a noticeable time to import, so it is only loaded for a Parquet export
+HAVE_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+# Flush text exports once this many bytes are buffered
+CHUNK_SIZE = 64 * 1024
+
+
+class ExportError(Exception):
+    """Raised when an export format cannot be produced"""
+
+
+def iter_csv(rows, fieldnames):
+    """Yield CSV text in chunks of roughly CHUNK_SIZE bytes"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows, fieldnames):
+    """Yield newline-delimited JSON, one object per project"""
+    chunk = []
+    size = 0
+    for row in rows:
+        line = json.dumps({field: row.get(field, '') for field in fieldnames}, ensure_ascii=False) + '\n'
+        chunk.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk, size = [], 0
+    yield ''.join(chunk)
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back in pieces
+
+    ParquetWriter only needs write/tell/flush; tell reports the total
+    written so the footer offsets stay correct even though the buffer
+    is drained after each row group.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_parquet(rows, fieldnames, row_group_size=5000):
+    """Yield a Parquet file, writing one row group per row_group_size projects"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(field, pa.string()) for field in fieldnames])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression='snappy')
+
+    def write_batch(batch):
+        columns = {field: [row.get(field, '') for row in batch] for field in fieldnames}
+        writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= row_group_size:
+            write_batch(batch)
+            batch = []
+            yield sink.drain()
+    if batch:
+        write_batch(batch)
+    writer.close()
+    yield sink.drain()
+
+
+def gzip_stream(chunks):
+    """Gzip-compress a stream of str/bytes chunks incrementally"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(rows, fmt, fieldnames):
+    """Return (chunk iterator, mimetype, file extension) for rows in the given format"""
+    if fmt not in FORMATS:
+        raise ExportError(f"Unknown export format {fmt!r}, expected one of {', '.join(FORMATS)}")
+    mimetype, extension = FORMATS[fmt]
+    if fmt == 'csv':
+        chunks = iter_csv(rows, fieldnames)
+    elif fmt == 'ndjson':
+        chunks = iter_ndjson(rows, fieldnames)
+    else:
+        if not HAVE_PYARROW:
+            raise ExportError("Parquet export needs pyarrow (pip install pyarrow)")
+        chunks = iter_parquet(rows, fieldnames)
+    return chunks, mimetype, extension
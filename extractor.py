@@ -0,0 +1,167 @@
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from metrics import REGISTRY
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+PROJECT_FIELDS = ['Rera Regd. No', 'Project Name', 'Promoter Name', 'Address of the Promoter', 'GST No']
+
+
+def _compile(patterns):
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+RERA_PATTERNS = _compile([
+    r'RERA\s*Reg(?:d)?\.?\s*No\.?\s*:?\s*([A-Z0-9/\-\.]+)',
+    r'Registration\s*No\.?\s*:?\s*([A-Z0-9/\-\.]+)',
+    r'Reg\.?\s*No\.?\s*:?\s*([A-Z0-9/\-\.]+)',
+    r'RP/\d+/\d+/\d+',
+    r'[A-Z]{2}/\d+/\d+/\d+'
+])
+
+PROJECT_NAME_PATTERNS = _compile([
+    r'Project\s*Name\s*:?\s*([A-Za-z0-9\s\-\.,&()]+?)(?=\s*Project\s*Type|\s*RERA|\s*Registration|\n|$)',
+    r'Project\s*Name\s*([A-Za-z0-9\s\-\.,&()]+?)(?=\s*Project\s*Type|\s*RERA|\s*Registration|\n|$)'
+])
+
+PROMOTER_PATTERNS = _compile([
+    r'Company\s*Name\s*:?\s*([M/S\.\s]*[A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company\s*Logo|\s*Registration|\s*Correspondence|\s*Email|\n\s*\n|$)',
+    r'Promoter\s*Name\s*:?\s*([M/S\.\s]*[A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company|\s*Registration|\s*Email|\n\s*\n|$)',
+    r'Promoter\s*:?\s*([M/S\.\s]*[A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company|\s*Registration|\s*Email|\n\s*\n|$)',
+    r'M/S\.\s*([A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company|\s*Registration|\s*Email|\n\s*\n|$)'
+])
+
+ADDRESS_PATTERNS = _compile([
+    r'Registered\s*Office\s*Address\s*:?\s*([A-Za-z0-9\s,\-\.:/()]+?)(?=\s*,{3,}|\s*Entity|\s*Email|\s*Mobile|\s*Phone|\n\s*\n|$)',
+    r'Office\s*Address\s*:?\s*([A-Za-z0-9\s,\-\.:/()]+?)(?=\s*,{3,}|\s*Entity|\s*Email|\s*Mobile|\s*Phone|\n\s*\n|$)',
+    r'Address\s*:?\s*([A-Za-z0-9\s,\-\.:/()]+?)(?=\s*,{3,}|\s*Entity|\s*Email|\s*Mobile|\s*Phone|\n\s*\n|$)'
+])
+
+GST_PATTERNS = _compile([
+    r'GST\s*No\.?\s*:?\s*([A-Z0-9]{15})',
+    r'GSTIN\s*:?\s*([A-Z0-9]{15})',
+    r'GST\s*:?\s*([A-Z0-9]{15})',
+    r'([0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}[Z]{1}[0-9A-Z]{1})'
+])
+
+WHITESPACE_RE = re.compile(r'\s+')
+COMMAS_RE = re.compile(r',+')
+REGISTRATION_SUFFIX_RE = re.compile(r'Registration.*$', re.IGNORECASE)
+COMPANY_LOGO_SUFFIX_RE = re.compile(r'Company Logo.*$', re.IGNORECASE)
+
+HEADER_TAGS = ['h1', 'h2', 'h3', 'h4']
+IGNORED_NAMES = ['projects', 'project', 'details']
+IGNORED_HEADERS = ['projects', 'project', 'details', 'orera', 'authority']
+
+# Restricts parsing to the tab panels when panels_only=True
+PANEL_STRAINER = SoupStrainer(class_=re.compile(r'\btab-pane\b'))
+
+
+def _clean_rera(match):
+    rera_no = match.group(1) if match.re.groups > 0 else match.group(0)
+    return REGISTRATION_SUFFIX_RE.sub('', rera_no).strip()
+
+
+def _clean_project_name(match):
+    project_name = WHITESPACE_RE.sub(' ', match.group(1).strip())
+    if len(project_name) > 3 and project_name.lower() not in IGNORED_NAMES:
+        return project_name
+    return ''
+
+
+def _clean_promoter(match):
+    promoter_name = WHITESPACE_RE.sub(' ', match.group(1).strip())
+    promoter_name = COMPANY_LOGO_SUFFIX_RE.sub('', promoter_name).strip()
+    return promoter_name if len(promoter_name) > 3 else ''
+
+
+def _clean_address(match):
+    address = WHITESPACE_RE.sub(' ', match.group(1).strip())
+    address = COMMAS_RE.sub(',', address)
+    return address if len(address) > 10 else ''
+
+
+def _clean_gst(match):
+    gst_no = match.group(1).strip()
+    return gst_no if len(gst_no) == 15 else ''
+
+
+# (field, compiled patterns in priority order, cleaner, read from promoter page)
+FIELD_RULES = [
+    ('Rera Regd. No', RERA_PATTERNS, _clean_rera, False),
+    ('Project Name', PROJECT_NAME_PATTERNS, _clean_project_name, False),
+    ('Promoter Name', PROMOTER_PATTERNS, _clean_promoter, True),
+    ('Address of the Promoter', ADDRESS_PATTERNS, _clean_address, True),
+    ('GST No', GST_PATTERNS, _clean_gst, True),
+]
+
+
+class ProjectExtractor:
+    """Pull the five project fields out of raw detail/promoter HTML
+
+    Patterns are compiled once at import time and each document is
+    parsed and flattened to text exactly once, so the same extractor
+    can be used on live pages or to re-parse archived HTML in bulk.
+    """
+
+    def __init__(self, parser=DEFAULT_PARSER, panels_only=False, verbose=True):
+        self.parser = parser
+        self.panels_only = panels_only
+        self.verbose = verbose
+
+    def parse(self, html):
+        """Parse html, limited to the tab panels when panels_only is set
+
+        Falls back to the full document when no tab panel is found.
+        """
+        if self.panels_only:
+            soup = BeautifulSoup(html, self.parser, parse_only=PANEL_STRAINER)
+            if soup.get_text().strip():
+                return soup
+        return BeautifulSoup(html, self.parser)
+
+    def extract(self, detail_html, promoter_html=None):
+        """Return a project record extracted from the detail page and optional Promoter tab HTML
+
+        RERA number and project name are read from the detail page; the
+        promoter fields are read from promoter_html when given, otherwise
+        from the detail page as well.
+        """
+        with REGISTRY.span('parse'):
+            soup = self.parse(detail_html)
+            detail_text = soup.get_text()
+            promoter_text = detail_text if promoter_html is None else self.parse(promoter_html).get_text()
+
+        project_data = {field: '' for field in PROJECT_FIELDS}
+        with REGISTRY.span('regex_extract'):
+            for field, patterns, clean, from_promoter in FIELD_RULES:
+                text = promoter_text if from_promoter else detail_text
+                for pattern in patterns:
+                    match = pattern.search(text)
+                    if not match:
+                        continue
+                    value = clean(match)
+                    # RERA numbers are taken from the first matching pattern even if blank
+                    if value or field == 'Rera Regd. No':
+                        project_data[field] = value
+                        break
+
+        # If project name not found, fall back to the page headers
+        if not project_data['Project Name']:
+            for element in soup.find_all(HEADER_TAGS):
+                text = element.get_text().strip()
+                if (text and len(text) > 3 and
+                        text.lower() not in IGNORED_HEADERS and
+                        'logo' not in text.lower()):
+                    project_data['Project Name'] = text
+                    break
+
+        if self.verbose:
+            for field, value in project_data.items():
+                if value:
+                    print(f"Found {field}: {value}")
+        return project_data
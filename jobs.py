@@ -0,0 +1,118 @@
+import itertools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class ScrapeJob:
+    """A single background scrape and the progress events it has produced"""
+
+    def __init__(self, params):
+        self.id = uuid.uuid4().hex[:12]
+        self.params = params
+        self.status = 'queued'
+        self.error = None
+        self.total = None
+        self.completed = 0
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.events = []
+        self.closed = False
+        self._seq = itertools.count(1)
+        self._changed = threading.Condition()
+
+    @property
+    def active(self):
+        return self.status in ACTIVE_STATUSES
+
+    def add_event(self, event_type, data, final=False):
+        """Append an event and wake up any stream waiting on this job
+
+        final marks the last event the job will ever produce.
+        """
+        with self._changed:
+            self.events.append({'id': next(self._seq), 'type': event_type, 'data': data})
+            self.closed = self.closed or final
+            self._changed.notify_all()
+
+    def events_after(self, last_id, timeout=None):
+        """Return events with id > last_id, waiting up to timeout seconds for new ones"""
+        with self._changed:
+            if timeout and not self.closed and (not self.events or self.events[-1]['id'] <= last_id):
+                self._changed.wait(timeout)
+            return [event for event in self.events if event['id'] > last_id]
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'error': self.error,
+            'total': self.total,
+            'completed': self.completed,
+            'params': self.params,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class JobManager:
+    """Run scrapes on a bounded thread pool, sharing one job between concurrent requests
+
+    target is called as target(on_project=callback, **params) and
+    callback(index, total, project_data) is invoked once per scraped
+    project. Only the most recent max_history jobs are kept.
+    """
+
+    def __init__(self, target, max_workers=1, max_history=50):
+        self.target = target
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scrape-job')
+        self.max_history = max_history
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, **params):
+        """Start a scrape, or return the one already queued/running
+
+        Returns (job, created) where created is False if the caller was
+        attached to an existing job.
+        """
+        with self.lock:
+            for job in self.jobs.values():
+                if job.active:
+                    return job, False
+            job = ScrapeJob(params)
+            self.jobs[job.id] = job
+            while len(self.jobs) > self.max_history:
+                self.jobs.popitem(last=False)
+            self.executor.submit(self._run, job)
+            return job, True
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def _run(self, job):
+        job.status = 'running'
+        job.started_at = time.time()
+        job.add_event('status', job.to_dict())
+
+        def on_project(index, total, project_data):
+            job.total = total
+            job.completed += 1
+            job.add_event('project', {'index': index, 'total': total, 'project': project_data})
+
+        try:
+            self.target(on_project=on_project, **job.params)
+            job.status = 'done'
+        except Exception as e:
+            print(f"Scrape job {job.id} failed: {e}")
+            job.status = 'failed'
+            job.error = str(e)
+        job.finished_at = time.time()
+        job.add_event(job.status, job.to_dict(), final=True)
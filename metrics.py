@@ -0,0 +1,178 @@
+import bisect
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+HELP = {
+    'scraper_phase_seconds': 'Time spent in each scraper phase',
+    'scraper_page_load_seconds': 'Latency of loading a page (driver.get or HTTP GET)',
+    'scraper_wait_seconds': 'Time spent in page-readiness waits',
+    'scraper_projects_total': 'Projects scraped, by outcome',
+    'scraper_empty_fields_total': 'Scraped projects with an empty field',
+    'scraper_retries_total': 'Retried or fallen-back operations',
+    'scraper_stale_elements_total': 'Stale element references hit during link discovery',
+    'scraper_wait_timeouts_total': 'Page-readiness waits that timed out',
+    'scraper_links_discovered_total': 'Project detail links found, by discovery method',
+    'scraper_throttle_wait_seconds': 'Time fetches waited for the politeness scheduler',
+    'scraper_throttle_decreases_total': 'Times the scheduler halved its rate and concurrency, by reason',
+    'scraper_rate_limit': 'Current request rate allowed by the politeness scheduler (per second)',
+    'scraper_concurrency_limit': 'Current number of concurrent fetches allowed by the politeness scheduler',
+    'scraper_lease_redeliveries_total': 'Work queue URLs handed to another worker after their lease expired',
+    'scraper_stale_results_total': 'Results dropped because the worker no longer held the lease',
+    'scraper_duplicates_total': 'Crawled projects skipped because their RERA number was already stored',
+}
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=None):
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+
+class Metrics:
+    """Thread-safe counters, gauges, histograms and timing spans for the scraper
+
+    Counters and histograms are cumulative for the life of the process,
+    gauges hold the last value set, and all of them are rendered in
+    Prometheus text format. Spans are also kept in a bounded list so a
+    run report can show per-project timings; take a snapshot() before a
+    run and pass it to report() to get just that run's numbers.
+    """
+
+    def __init__(self, max_spans=10000):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.spans = deque(maxlen=max_spans)
+        self.span_seq = 0
+
+    def inc(self, name, value=1, **labels):
+        with self.lock:
+            key = (name, _label_key(labels))
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        with self.lock:
+            key = (name, _label_key(labels))
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def span(self, phase, detail=None, **labels):
+        """Time a block as one phase
+
+        The duration goes into scraper_phase_seconds{phase=...} and the
+        span list; detail (e.g. the project URL) is kept only in the
+        span list so it never becomes a Prometheus label.
+        """
+        start = time.perf_counter()
+        started_at = time.time()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.observe('scraper_phase_seconds', duration, phase=phase, **labels)
+            with self.lock:
+                self.span_seq += 1
+                self.spans.append({'seq': self.span_seq, 'phase': phase, 'labels': labels, 'detail': detail,
+                                   'started_at': started_at, 'seconds': round(duration, 6)})
+
+    def snapshot(self):
+        """Capture the current totals so report() can show the difference"""
+        with self.lock:
+            return {
+                'counters': dict(self.counters),
+                'histograms': {key: (h.count, h.sum) for key, h in self.histograms.items()},
+                'span_seq': self.span_seq,
+            }
+
+    def report(self, since=None):
+        """Return a JSON-serialisable summary, relative to a snapshot() if given"""
+        since = since or {'counters': {}, 'histograms': {}, 'span_seq': 0}
+        with self.lock:
+            counters = []
+            for (name, key), value in sorted(self.counters.items()):
+                delta = value - since['counters'].get((name, key), 0)
+                if delta:
+                    counters.append({'name': name, 'labels': dict(key), 'value': delta})
+            histograms = []
+            for (name, key), h in sorted(self.histograms.items()):
+                count, total = since['histograms'].get((name, key), (0, 0.0))
+                if h.count - count:
+                    histograms.append({'name': name, 'labels': dict(key), 'count': h.count - count,
+                                       'sum': round(h.sum - total, 6),
+                                       'mean': round((h.sum - total) / (h.count - count), 6)})
+            spans = [span for span in self.spans if span['seq'] > since['span_seq']]
+        return {'generated_at': time.time(), 'counters': counters, 'histograms': histograms, 'spans': spans}
+
+    def write_report(self, path, since=None):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(since), f, indent=2)
+        print(f"Run report written to {path}")
+
+    def render_prometheus(self):
+        """Render all counters and histograms in the Prometheus text exposition format"""
+        lines = []
+        seen = set()
+
+        def header(name, kind):
+            if name not in seen:
+                seen.add(name)
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        with self.lock:
+            for (name, key), value in sorted(self.counters.items()):
+                header(name, 'counter')
+                lines.append(f"{name}{_format_labels(key)} {value}")
+            for (name, key), value in sorted(self.gauges.items()):
+                header(name, 'gauge')
+                lines.append(f"{name}{_format_labels(key)} {value}")
+            for (name, key), h in sorted(self.histograms.items()):
+                header(name, 'histogram')
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', bound))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {h.count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {h.sum}")
+                lines.append(f"{name}_count{_format_labels(key)} {h.count}")
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry shared by the scraper and the Flask app
+REGISTRY = Metrics()
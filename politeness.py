@@ -0,0 +1,122 @@
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from metrics import REGISTRY
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """Seconds to wait before retry number attempt (1-based): exponential with full jitter"""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class PolitenessScheduler:
+    """Pace every page fetch with a token bucket and an AIMD concurrency limit
+
+    Each fetch runs inside request(): it waits until fewer than `limit`
+    fetches are in flight and a token is available (tokens refill at
+    `rate` per second, up to `burst`). When the fetch finishes the
+    outcome adjusts both knobs, additive-increase/multiplicative-decrease
+    style: a success with the smoothed latency under target_latency
+    raises the limit by about one per round of requests and the rate by
+    rate_step; an error, a timeout, or a smoothed latency above target
+    halves both, at most once per cooldown seconds so one burst of
+    failures only counts once.
+
+    One scheduler is shared by every scraper (and worker thread) that
+    talks to the same site.
+    """
+
+    def __init__(self, rate=1.0, max_rate=5.0, min_rate=0.1, burst=2, concurrency=1, max_concurrency=4,
+                 target_latency=3.0, rate_step=0.05, cooldown=None, window=50):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.limit = float(concurrency)
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.rate_step = rate_step
+        self.cooldown = target_latency if cooldown is None else cooldown
+        self.condition = threading.Condition()
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.in_flight = 0
+        self.latency_ewma = None
+        self.last_decrease = 0.0
+        self.outcomes = deque(maxlen=window)
+        self._publish()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+    def acquire(self):
+        """Block until a concurrency slot and a token are free; returns seconds waited"""
+        start = time.monotonic()
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.in_flight < int(self.limit) and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    break
+                # Sleep until the next token is due; release() wakes us early when a slot frees up
+                self.condition.wait(max(0.01, (1 - self.tokens) / self.rate))
+        waited = time.monotonic() - start
+        REGISTRY.observe('scraper_throttle_wait_seconds', waited)
+        return waited
+
+    def release(self, latency, ok):
+        """Record a finished fetch and adjust the rate and concurrency limit"""
+        with self.condition:
+            self.in_flight -= 1
+            self.outcomes.append(ok)
+            if ok:
+                self.latency_ewma = latency if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * latency
+            now = time.monotonic()
+            if not ok or self.latency_ewma > self.target_latency:
+                if now - self.last_decrease >= self.cooldown:
+                    self.last_decrease = now
+                    self.limit = max(1.0, self.limit / 2)
+                    self.rate = max(self.min_rate, self.rate / 2)
+                    REGISTRY.inc('scraper_throttle_decreases_total', reason='error' if not ok else 'latency')
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+                self.rate = min(self.max_rate, self.rate + self.rate_step)
+            self._publish()
+            self.condition.notify_all()
+
+    @contextmanager
+    def request(self):
+        """Run one fetch under the schedule; an exception counts as a failed fetch"""
+        self.acquire()
+        start = time.monotonic()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.release(time.monotonic() - start, ok)
+
+    def error_rate(self):
+        """Fraction of the last `window` fetches that failed"""
+        with self.condition:
+            return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def _publish(self):
+        REGISTRY.set('scraper_rate_limit', self.rate)
+        REGISTRY.set('scraper_concurrency_limit', int(self.limit))
+
+    def stats(self):
+        with self.condition:
+            return {
+                'rate': round(self.rate, 3),
+                'concurrency': int(self.limit),
+                'in_flight': self.in_flight,
+                'latency_ewma': round(self.latency_ewma or 0.0, 3),
+                'error_rate': round(self.outcomes.count(False) / len(self.outcomes), 3) if self.outcomes else 0.0,
+            }
@@ -1,39 +1,470 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import time
-import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.support.ui import Select
+from extractor import PROJECT_FIELDS, ProjectExtractor
+from cache import DEFAULT_TTL, SnapshotCache
+from storage import DEFAULT_DB_PATH, ProjectStore
+from metrics import REGISTRY
+from politeness import PolitenessScheduler, backoff_delay
+from browsers import new_driver
+
+
+def empty_project_data():
+    """Return a project record with every field blank"""
+    return {field: '' for field in PROJECT_FIELDS}
+
+
+LISTING_URL = "https://rera.odisha.gov.in/projects/project-list"
+
+CARD_SELECTORS = [
+    ".card.project-card.mb-3",
+    ".card.project-card",
+    "div[class*='project-card']",
+    ".card",
+    "div[class*='card']"
+]
+
+# Detail pages live under this path; anchors and router links containing it point at projects
+DETAIL_PATH_MARKER = 'project-details'
+DETAIL_LINK_ATTRIBUTES = ['href', 'routerlink', 'ng-reflect-router-link', 'data-href']
+
+# Collects detail URLs from anchors and Angular router links in document order
+DETAIL_LINKS_JS = """
+const marker = arguments[0], attributes = arguments[1];
+const urls = [], seen = new Set();
+const selector = attributes.map(attr => '[' + attr + ']').join(',');
+for (const element of document.querySelectorAll(selector)) {
+    for (const attr of attributes) {
+        const value = element.getAttribute(attr);
+        if (value && value.includes(marker)) {
+            const url = new URL(value, document.baseURI).href;
+            if (!seen.has(url)) { seen.add(url); urls.push(url); }
+            break;
+        }
+    }
+}
+return urls;
+"""
+
+LINK_DISCOVERY_MODES = ('auto', 'http', 'dom', 'click')
+
+# Listing filters and pagination
+DISTRICT_SELECT_XPATH = ("//select[contains(translate(@id, 'DISTRICT', 'district'), 'district') or "
+                         "contains(translate(@name, 'DISTRICT', 'district'), 'district') or "
+                         "option[contains(., 'District')]]")
+SEARCH_BUTTON_XPATH = "//button[contains(., 'Search') or contains(., 'Filter') or @type='submit']"
+PAGER_ACTIVE_CSS = "ul.pagination li.active"
+PAGER_NUMBER_XPATH = "//ul[contains(@class, 'pagination')]//a[normalize-space()='{page}']"
+PAGER_NEXT_XPATH = ("//ul[contains(@class, 'pagination')]//a[contains(., 'Next') or contains(., '»') "
+                    "or @aria-label='Next']")
+PLACEHOLDER_OPTIONS = ['', 'select', 'select district', 'all', '--select--']
+
+PROMOTER_TAB_XPATH = "//a[contains(text(),'Promoter') or contains(@href,'promoter')]"
+
+# Text that only shows up once the Promoter tab panel has been filled in
+PROMOTER_PANEL_MARKERS = ['Company Name', 'Registered Office', 'GST No', 'GSTIN']
+
+# Per-step timeouts (seconds) for the page-readiness waits
+WAIT_TIMEOUTS = {
+    'project_list': 20,
+    'after_scroll': 5,
+    'details_url': 10,
+    'back_to_list': 10,
+    'more_cards': 5,
+    'details_page': 15,
+    'promoter_tab': 10,
+    'listing_page': 10,
+}
+
+# Fields the HTTP fast path must fill before its result is trusted without a Selenium fallback
+REQUIRED_FIELDS = ['Rera Regd. No', 'Project Name', 'Promoter Name']
+
+BACKENDS = ('selenium', 'http')
+
+# Attempts after the first for a project whose page could not be scraped at all
+DEFAULT_RETRIES = 3
+
+HTTP_HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/125.0 Safari/537.36'),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+def create_http_session(pool_size=10, retries=2):
+    """Create a keep-alive requests.Session with a connection pool sized for pool_size workers"""
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    # Only connection failures are retried here; error responses are left to the
+    # politeness scheduler so they slow the crawl down and get a jittered backoff
+    retry = Retry(connect=retries, read=0, status=0, backoff_factor=0.5, allowed_methods=['GET'])
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def is_retryable(error):
+    """False for a 4xx response other than 429: the page is missing or refused and asking again will not help"""
+    response = getattr(error, 'response', None)
+    if isinstance(error, requests.HTTPError) and response is not None:
+        return not (400 <= response.status_code < 500) or response.status_code == 429
+    return True
+
+
+def listing_page_url(listing_url, page=1, district=None):
+    """Return listing_url with the page number and district filter as query parameters"""
+    scheme, netloc, path, query, fragment = urlsplit(listing_url)
+    params = [query] if query else []
+    extra = {}
+    if page > 1:
+        extra['page'] = page
+    if district:
+        extra['district'] = district
+    if extra:
+        params.append(urlencode(extra))
+    return urlunsplit((scheme, netloc, path, '&'.join(params), fragment))
+
+
+def extract_detail_links(html, base_url, parser='html.parser'):
+    """Return the project detail URLs linked from listing HTML, in page order"""
+    soup = BeautifulSoup(html, parser)
+    links = []
+    for element in soup.find_all(lambda tag: any(tag.has_attr(attr) for attr in DETAIL_LINK_ATTRIBUTES)):
+        for attr in DETAIL_LINK_ATTRIBUTES:
+            value = element.get(attr)
+            if value and DETAIL_PATH_MARKER in value:
+                links.append(urljoin(base_url, value))
+                break
+    return list(dict.fromkeys(links))
+
+
+def count_project_cards(driver):
+    """Return the number of project cards matched by the first selector that finds more than one"""
+    for selector in CARD_SELECTORS:
+        cards = driver.find_elements(By.CSS_SELECTOR, selector)
+        if len(cards) > 1:
+            return len(cards)
+    return 0
+
+
+def project_cards_present(min_count=1):
+    """Readiness condition: at least min_count project cards are in the DOM"""
+    return lambda driver: count_project_cards(driver) >= max(min_count, 2)
+
+
+def url_changed_from(old_url):
+    """Readiness condition: the browser has navigated away from old_url"""
+    return lambda driver: driver.current_url != old_url
+
+
+def details_page_loaded(driver):
+    """Readiness condition: the project-details view has rendered its tabs or fields"""
+    if driver.execute_script("return document.readyState") != 'complete':
+        return False
+    if driver.find_elements(By.XPATH, PROMOTER_TAB_XPATH):
+        return True
+    return 'Project Name' in driver.find_element(By.TAG_NAME, 'body').text
+
+
+def promoter_panel_filled(driver):
+    """Readiness condition: the Promoter tab panel shows promoter details"""
+    for pane in driver.find_elements(By.CSS_SELECTOR, ".tab-pane.active, .tab-pane.show"):
+        if any(marker in pane.text for marker in PROMOTER_PANEL_MARKERS):
+            return True
+    body_text = driver.find_element(By.TAG_NAME, 'body').text
+    return any(marker in body_text for marker in PROMOTER_PANEL_MARKERS)
+
 
 class RERAOdishaScraper:
-    def __init__(self):
-        """Initialize the scraper with Chrome driver"""
-        print("Setting up Chrome driver...")
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        # Uncomment the next line if you want to run in headless mode (no browser window)
-        # chrome_options.add_argument('--headless')
+    def __init__(self, headless=True, wait_timeouts=None, backend='selenium', session=None,
+                 http_timeout=20, cache=None, listing_url=LISTING_URL, link_discovery='auto', scheduler=None,
+                 retries=DEFAULT_RETRIES, driver=None, browser_pool=None, block_resources=True):
+        """Initialize the scraper
+
+        backend='selenium' starts Chrome straight away. backend='http'
+        fetches detail pages over a pooled requests.Session and only
+        starts Chrome if a page needs the Selenium fallback (or when
+        link discovery runs).
+        
+        cache is an optional SnapshotCache; pages whose HTML hashes the
+        same as the cached copy reuse the previously extracted row.
+        listing_url can point at a local stand-in of the portal.
+        
+        link_discovery picks how project URLs are collected from the
+        listing: 'http' parses the fetched listing HTML, 'dom' reads
+        anchors and router links from the rendered page, and 'click'
+        opens every card. 'auto' tries http (http backend only) then
+        dom; click-through is always the last resort.
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.maximize_window()
-        self.wait = WebDriverWait(self.driver, 10)
+        scheduler is the PolitenessScheduler every page fetch goes
+        through; pass the same one to all scrapers hitting the site.
+        A project whose page could not be scraped at all is retried up
+        to `retries` times with jittered exponential backoff.
+        
+        Chrome comes from, in order: an injected driver (left running by
+        close()), a browser leased from browser_pool (handed back by
+        close()), or a new browser of our own. Our own browsers block
+        images, fonts, CSS and analytics unless block_resources=False.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        if link_discovery not in LINK_DISCOVERY_MODES:
+            raise ValueError(f"Unknown link discovery {link_discovery!r}, expected one of {LINK_DISCOVERY_MODES}")
+        self.link_discovery = link_discovery
+        self.backend = backend
+        self.headless = headless
+        self.http_timeout = http_timeout
+        self.listing_url = listing_url
+        self.wait_timeouts = dict(WAIT_TIMEOUTS, **(wait_timeouts or {}))
+        self.wait_timings = []
+        self._driver = driver
+        self._owns_driver = False
+        self.browser_pool = browser_pool
+        self.block_resources = block_resources
+        self._lease = None
+        self.pages_loaded = 0
+        self.extractor = ProjectExtractor()
+        self.cache = cache
+        self.scheduler = scheduler if scheduler is not None else PolitenessScheduler()
+        self.retries = retries
+        self._owns_session = session is None and backend == 'http'
+        self.session = session if session is not None else (create_http_session() if backend == 'http' else None)
+        
+        if backend == 'selenium':
+            self.start_driver()
+    
+    def start_driver(self):
+        """Start Chrome if it is not already running"""
+        if self._driver is not None:
+            return self._driver
+        if self.browser_pool is not None:
+            self._lease = self.browser_pool.acquire()
+            self._driver = self._lease.driver
+        else:
+            print("Setting up Chrome driver...")
+            self._driver = new_driver(self.headless, self.block_resources)
+            self._owns_driver = True
+        self.wait = WebDriverWait(self._driver, 10)
+        return self._driver
+    
+    @property
+    def driver(self):
+        """The Chrome driver, started on first use"""
+        return self.start_driver()
+    
+    def wait_until(self, step, condition):
+        """Block until condition holds or the step's timeout expires
+
+        Returns True if the page became ready in time. Every wait is
+        recorded in self.wait_timings with how long it actually took.
+        """
+        timeout = self.wait_timeouts.get(step, 10)
+        start = time.perf_counter()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2,
+                          ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)).until(condition)
+            ready = True
+        except TimeoutException:
+            print(f"Timed out after {timeout}s waiting for {step}")
+            REGISTRY.inc('scraper_wait_timeouts_total', step=step)
+            ready = False
+        elapsed = time.perf_counter() - start
+        REGISTRY.observe('scraper_wait_seconds', elapsed, step=step)
+        self.wait_timings.append({'step': step, 'seconds': round(elapsed, 3), 'ready': ready})
+        return ready
+    
+    def wait_summary(self):
+        """Summarize recorded waits per step: count, total, max seconds and timeouts"""
+        summary = {}
+        for timing in self.wait_timings:
+            step = summary.setdefault(timing['step'], {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            step['count'] += 1
+            step['total'] = round(step['total'] + timing['seconds'], 3)
+            step['max'] = max(step['max'], timing['seconds'])
+            if not timing['ready']:
+                step['timeouts'] += 1
+        return summary
         
     def get_project_links(self, max_projects=6):
-        """Get project links from the main page"""
+        """Get project links from the main page
+
+        Reads the detail URLs straight out of the listing where possible
+        and only falls back to clicking through each card when the
+        listing exposes no links.
+        """
+        if self.link_discovery == 'auto':
+            methods = ['http', 'dom'] if self.backend == 'http' else ['dom']
+        elif self.link_discovery == 'click':
+            methods = []
+        else:
+            methods = [self.link_discovery]
+        
+        for method in methods:
+            try:
+                if method == 'http':
+                    project_links = self.discover_links_http(max_projects)
+                else:
+                    project_links = self.discover_links_dom(max_projects)
+            except Exception as e:
+                print(f"Link discovery via {method} failed: {e}")
+                project_links = []
+            if project_links:
+                REGISTRY.inc('scraper_links_discovered_total', len(project_links), method=method)
+                print(f"\nFound {len(project_links)} project detail links in the listing ({method}):")
+                for i, link in enumerate(project_links, 1):
+                    print(f"{i}. {link}")
+                return project_links
+            print(f"No detail links found via {method}")
+        
+        if methods:
+            print("Falling back to clicking through project cards")
+            REGISTRY.inc('scraper_retries_total', kind='click_discovery')
+        project_links = self.get_project_links_by_clicking(max_projects)
+        REGISTRY.inc('scraper_links_discovered_total', len(project_links), method='click')
+        return project_links
+    
+    def discover_links_http(self, max_projects=6, page=1, district=None):
+        """Collect detail URLs from the listing HTML fetched without a browser"""
+        if self.session is None:
+            self.session = create_http_session()
+            self._owns_session = True
+        response = self.http_get(listing_page_url(self.listing_url, page, district))
+        return extract_detail_links(response.text, response.url, self.extractor.parser)[:max_projects]
+    
+    def discover_links_dom(self, max_projects=6, page=1, district=None):
+        """Collect detail URLs from anchors/router links in the rendered listing
+
+        Scrolls to the bottom until either max_projects links are known or
+        scrolling stops revealing new cards, in a single visit to the page.
+        """
         print("Navigating to RERA Odisha projects page...")
-        self.driver.get("https://rera.odisha.gov.in/projects/project-list")
-             
-        # Wait for the page to load completely
-        time.sleep(8)
+        with REGISTRY.span('listing_load'):
+            if not self.open_listing(page, district):
+                return []
+        
+        project_links = self.driver.execute_script(DETAIL_LINKS_JS, DETAIL_PATH_MARKER, DETAIL_LINK_ATTRIBUTES)
+        while len(project_links) < max_projects:
+            loaded_cards = count_project_cards(self.driver)
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            if not self.wait_until('more_cards', project_cards_present(loaded_cards + 1)):
+                break
+            project_links = self.driver.execute_script(DETAIL_LINKS_JS, DETAIL_PATH_MARKER, DETAIL_LINK_ATTRIBUTES)
+        return project_links[:max_projects]
+    
+    def open_listing(self, page=1, district=None):
+        """Show one page of the rendered listing, optionally filtered by district
+
+        The page and district are passed as URL parameters first; if the
+        site ignores them, the district dropdown is used and the pager is
+        stepped through. Returns False if the page does not exist.
+        """
+        self.load_page(listing_page_url(self.listing_url, page, district))
+        if not self.wait_until('project_list', project_cards_present()):
+            return False
+        if district and self.select_district(district):
+            self.wait_until('project_list', project_cards_present())
+        return self.goto_listing_page(page)
+    
+    def district_select(self):
+        """Return the district dropdown of the listing as a Select, or None"""
+        elements = self.driver.find_elements(By.XPATH, DISTRICT_SELECT_XPATH)
+        return Select(elements[0]) if elements else None
+    
+    def list_districts(self):
+        """Return the district names offered by the listing's filter dropdown"""
+        self.load_page(self.listing_url)
+        self.wait_until('project_list', project_cards_present())
+        select = self.district_select()
+        if select is None:
+            print("No district filter found on the listing")
+            return []
+        return [option.text.strip() for option in select.options
+                if option.text.strip().lower() not in PLACEHOLDER_OPTIONS]
+    
+    def select_district(self, district):
+        """Pick district in the dropdown and apply the filter; returns False if there is no such option"""
+        select = self.district_select()
+        if select is None:
+            return False
+        if select.first_selected_option.text.strip() == district:
+            return True
+        try:
+            select.select_by_visible_text(district)
+        except NoSuchElementException:
+            print(f"District {district!r} not offered by the listing filter")
+            return False
+        buttons = self.driver.find_elements(By.XPATH, SEARCH_BUTTON_XPATH)
+        if buttons:
+            self.driver.execute_script("arguments[0].click();", buttons[0])
+        return True
+    
+    def active_listing_page(self):
+        """Return the page number highlighted in the pager, or None if there is no pager"""
+        active = self.driver.find_elements(By.CSS_SELECTOR, PAGER_ACTIVE_CSS)
+        text = active[0].text.strip() if active else ''
+        return int(text) if text.isdigit() else None
+    
+    def goto_listing_page(self, page):
+        """Step the pager until it shows page; returns False if the page cannot be reached"""
+        current = self.active_listing_page()
+        while current is not None and current != page:
+            if current > page:
+                return False
+            links = (self.driver.find_elements(By.XPATH, PAGER_NUMBER_XPATH.format(page=page)) or
+                     self.driver.find_elements(By.XPATH, PAGER_NEXT_XPATH))
+            if not links:
+                return False
+            self.driver.execute_script("arguments[0].click();", links[0])
+            before = current
+            if not self.wait_until('listing_page', lambda driver: self.active_listing_page() != before):
+                return False
+            current = self.active_listing_page()
+        return True
+    
+    def get_listing_page_links(self, page=1, district=None):
+        """Return every detail URL on one listing page (empty once past the last page)"""
+        if self.link_discovery == 'auto':
+            methods = ['http', 'dom'] if self.backend == 'http' else ['dom']
+        elif self.link_discovery == 'click':
+            # Click-through has no notion of pages; read the rendered page instead
+            methods = ['dom']
+        else:
+            methods = [self.link_discovery]
+        
+        for method in methods:
+            try:
+                if method == 'http':
+                    project_links = self.discover_links_http(10 ** 6, page, district)
+                else:
+                    project_links = self.discover_links_dom(10 ** 6, page, district)
+            except Exception as e:
+                print(f"Listing page {page} via {method} failed: {e}")
+                project_links = []
+            if project_links:
+                REGISTRY.inc('scraper_links_discovered_total', len(project_links), method=method)
+                return project_links
+        return []
+    
+    def get_project_links_by_clicking(self, max_projects=6):
+        """Get project links by opening each card's View Details and going back"""
+        print("Navigating to RERA Odisha projects page...")
+        with REGISTRY.span('listing_load'):
+            self.load_page(self.listing_url)
+            
+            # Wait until the project cards have rendered
+            self.wait_until('project_list', project_cards_present())
         
         try:
             project_links = []
@@ -43,18 +474,12 @@ class RERAOdishaScraper:
             
             # Scroll down to ensure all projects are loaded
             self.driver.execute_script("window.scrollTo(0, 1000);")
-            time.sleep(3)
+            self.wait_until('after_scroll', project_cards_present())
             
             while processed_projects < max_projects:
                 # Re-find project cards each time to avoid stale element references
                 project_cards = []
-                selectors = [
-                    ".card.project-card.mb-3",
-                    ".card.project-card",
-                    "div[class*='project-card']",
-                    ".card",
-                    "div[class*='card']"
-                ]
+                selectors = CARD_SELECTORS
                 
                 for selector in selectors:
                     cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
@@ -103,15 +528,16 @@ class RERAOdishaScraper:
                                         try:
                                             # Scroll element into view
                                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                                            time.sleep(1)
                                             
                                             # Try clicking
-                                            try:
-                                                element.click()
-                                            except:
-                                                self.driver.execute_script("arguments[0].click();", element)
-                                            
-                                            time.sleep(4)
+                                            with REGISTRY.span('card_click'):
+                                                try:
+                                                    element.click()
+                                                except:
+                                                    REGISTRY.inc('scraper_retries_total', kind='js_click')
+                                                    self.driver.execute_script("arguments[0].click();", element)
+                                                
+                                                self.wait_until('details_url', url_changed_from(current_url))
                                             new_url = self.driver.current_url
                                             
                                             if (new_url != current_url and 
@@ -123,15 +549,16 @@ class RERAOdishaScraper:
                                                 print(f"✓ Added project {processed_projects}: {new_url}")
                                                 
                                                 # Go back to main page
-                                                self.driver.back()
-                                                time.sleep(4)
+                                                with REGISTRY.span('back_navigation'):
+                                                    self.driver.back()
+                                                    self.wait_until('back_to_list', project_cards_present(i + 1))
                                                 self.driver.execute_script("window.scrollTo(0, 1000);")
-                                                time.sleep(2)
                                                 break
                                             else:
                                                 if new_url != current_url:
-                                                    self.driver.back()
-                                                    time.sleep(2)
+                                                    with REGISTRY.span('back_navigation'):
+                                                        self.driver.back()
+                                                        self.wait_until('back_to_list', project_cards_present(i + 1))
                                                     
                                         except Exception as click_error:
                                             print(f"Click error: {click_error}")
@@ -141,6 +568,7 @@ class RERAOdishaScraper:
                                     break
                             except StaleElementReferenceException:
                                 print("Stale element reference, breaking to re-scan")
+                                REGISTRY.inc('scraper_stale_elements_total')
                                 break
                             except Exception as e:
                                 print(f"Error with selector {selector}: {e}")
@@ -151,6 +579,7 @@ class RERAOdishaScraper:
                             
                     except StaleElementReferenceException:
                         print(f"Stale element for card {i+1}, re-scanning...")
+                        REGISTRY.inc('scraper_stale_elements_total')
                         break
                     except Exception as e:
                         print(f"Error processing card {i+1}: {e}")
@@ -161,8 +590,9 @@ class RERAOdishaScraper:
                     if processed_projects == 0:
                         break
                     # Try scrolling to load more projects
+                    loaded_cards = count_project_cards(self.driver)
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(3)
+                    self.wait_until('more_cards', project_cards_present(loaded_cards + 1))
             
             # Remove duplicates
             project_links = list(dict.fromkeys(project_links))
@@ -180,186 +610,251 @@ class RERAOdishaScraper:
             return []
     
     def scrape_project_details(self, project_url):
-        """Scrape details from a single project page"""
-        print(f"\nScraping project: {project_url}")
+        """Scrape details from a single project page using the configured backend
+
+        With the http backend, a page that was fetched but lacks required
+        fields is retried in the browser. A failed fetch (connection error,
+        timeout or error response) raises instead, so the caller's retry
+        and backoff handle it rather than a browser hitting the same
+        server; see is_retryable() for the errors worth retrying.
+        """
+        with REGISTRY.span('project', detail=project_url, backend=self.backend):
+            project_data = None
+            if self.backend == 'http':
+                project_data = self.scrape_project_details_http(project_url)
+                missing = [field for field in REQUIRED_FIELDS if not project_data[field]]
+                if missing:
+                    print(f"HTTP fetch incomplete (missing {', '.join(missing)}), falling back to Selenium")
+                    REGISTRY.inc('scraper_retries_total', kind='selenium_fallback')
+                    project_data = None
+            if project_data is None:
+                project_data = self.scrape_project_details_selenium(project_url)
         
+        for field in PROJECT_FIELDS:
+            if not project_data[field]:
+                REGISTRY.inc('scraper_empty_fields_total', field=field)
+        REGISTRY.inc('scraper_projects_total', outcome='complete' if all(project_data.values()) else 'partial')
+        return project_data
+    
+    def scrape_project_with_retries(self, project_url):
+        """scrape_project_details, retried with jittered exponential backoff when nothing was scraped
+
+        A page that is missing or refused (4xx other than 429) is given up
+        on straight away.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                project_data = self.scrape_project_details(project_url)
+                if any(project_data[field] for field in REQUIRED_FIELDS):
+                    return project_data
+                error = "no fields scraped"
+            except Exception as e:
+                project_data = empty_project_data()
+                error = e
+                if not is_retryable(e):
+                    print(f"Project {project_url} failed ({e}), not retrying")
+                    return project_data
+            if attempt < self.retries:
+                delay = backoff_delay(attempt + 1)
+                print(f"Project {project_url} failed ({error}), retrying in {delay:.1f}s")
+                REGISTRY.inc('scraper_retries_total', kind='backoff')
+                time.sleep(delay)
+        print(f"Giving up on {project_url} after {self.retries + 1} attempts")
+        return project_data
+    
+    def load_page(self, url):
+        """Navigate the browser to url, recording the page-load latency
+
+        A browser leased from a pool is swapped for a fresh one first if
+        it has reached the pool's page or memory limit.
+        """
+        if self._lease is not None:
+            lease = self.browser_pool.renew(self._lease)
+            if lease is not self._lease:
+                self._lease = lease
+                self._driver = lease.driver
+                self.wait = WebDriverWait(self._driver, 10)
+        driver = self.driver
+        with self.scheduler.request():
+            start = time.perf_counter()
+            driver.get(url)
+        self.pages_loaded += 1
+        if self._lease is not None:
+            self._lease.pages += 1
+        REGISTRY.observe('scraper_page_load_seconds', time.perf_counter() - start, backend='selenium')
+    
+    def http_get(self, url):
+        """GET url with the pooled session, recording the page-load latency"""
+        with self.scheduler.request():
+            start = time.perf_counter()
+            response = self.session.get(url, timeout=self.http_timeout)
+            REGISTRY.observe('scraper_page_load_seconds', time.perf_counter() - start, backend='http')
+            # Throttling and server errors count against the schedule; a 404 is just a missing page
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
+        # Other 4xx responses raise too, and is_retryable() tells callers not to ask again
+        response.raise_for_status()
+        return response
+    
+    def scrape_project_details_http(self, project_url):
+        """Fetch a project page and its Promoter tab over HTTP, without a browser
+
+        Raises requests.RequestException when the pages could not be fetched.
+        """
+        print(f"\nFetching project over HTTP: {project_url}")
         try:
-            self.driver.get(project_url)
-            time.sleep(5)
-            
-            project_data = {
-                'Rera Regd. No': '',
-                'Project Name': '',
-                'Promoter Name': '',
-                'Address of the Promoter': '',
-                'GST No': ''
-            }
-            
-            # Get page source and parse with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            page_text = soup.get_text()
-            
-            # Extract RERA Registration Number
-            rera_patterns = [
-                r'RERA\s*Reg(?:d)?\.?\s*No\.?\s*:?\s*([A-Z0-9/\-\.]+)',
-                r'Registration\s*No\.?\s*:?\s*([A-Z0-9/\-\.]+)',
-                r'Reg\.?\s*No\.?\s*:?\s*([A-Z0-9/\-\.]+)',
-                r'RP/\d+/\d+/\d+',
-                r'[A-Z]{2}/\d+/\d+/\d+'
-            ]
-            
-            for pattern in rera_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    rera_no = match.group(1) if len(match.groups()) > 0 else match.group(0)
-                    rera_no = re.sub(r'Registration.*$', '', rera_no, flags=re.IGNORECASE).strip()
-                    project_data['Rera Regd. No'] = rera_no
-                    print(f"Found RERA No: {rera_no}")
-                    break
-            
-            # Extract Project Name - improved extraction
-            # First try to find it in the project details section
-            project_name_patterns = [
-                r'Project\s*Name\s*:?\s*([A-Za-z0-9\s\-\.,&()]+?)(?=\s*Project\s*Type|\s*RERA|\s*Registration|\n|$)',
-                r'Project\s*Name\s*([A-Za-z0-9\s\-\.,&()]+?)(?=\s*Project\s*Type|\s*RERA|\s*Registration|\n|$)'
-            ]
-            
-            for pattern in project_name_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    project_name = match.group(1).strip()
-                    # Clean up project name
-                    project_name = re.sub(r'\s+', ' ', project_name)
-                    if len(project_name) > 3 and project_name.lower() not in ['projects', 'project', 'details']:
-                        project_data['Project Name'] = project_name
-                        print(f"Found Project Name: {project_name}")
-                        break
-            
-            # If project name not found, try alternative selectors
-            if not project_data['Project Name']:
+            detail_html, promoter_html = self.fetch_project_pages_http(project_url)
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed for {project_url}: {e}")
+            raise
+        try:
+            return self.extract_project_data(detail_html, promoter_html, project_url)
+        except Exception as e:
+            print(f"Could not extract {project_url}: {e}")
+            return empty_project_data()
+    
+    def fetch_project_pages_http(self, project_url):
+        """Return (detail_html, promoter_html) fetched with the pooled session
+
+        The Promoter tab is followed when it links to a separate page; when
+        it is an in-page tab (fragment link) the detail HTML already holds
+        the promoter panel. promoter_html is None if no tab was found, or
+        if the Promoter page is missing (a 4xx other than 429), so that the
+        detail page is still used.
+        """
+        response = self.http_get(project_url)
+        detail_html = response.text
+        
+        soup = BeautifulSoup(detail_html, self.extractor.parser)
+        promoter_html = None
+        for link in soup.find_all('a'):
+            href = link.get('href') or ''
+            if 'Promoter' not in link.get_text() and 'promoter' not in href:
+                continue
+            if not href or href.startswith('#') or href.startswith('javascript:'):
+                promoter_html = detail_html
+            else:
                 try:
-                    # Look for specific elements that might contain project name
-                    project_name_elements = soup.find_all(['h1', 'h2', 'h3', 'h4'])
-                    for element in project_name_elements:
-                        text = element.get_text().strip()
-                        if (text and len(text) > 3 and 
-                            text.lower() not in ['projects', 'project', 'details', 'orera', 'authority'] and
-                            'logo' not in text.lower()):
-                            project_data['Project Name'] = text
-                            print(f"Found Project Name from header: {text}")
-                            break
-                except:
-                    pass
+                    promoter_html = self.http_get(urljoin(response.url, href)).text
+                except requests.HTTPError as e:
+                    if is_retryable(e):
+                        raise
+                    print(f"Promoter page {href} unavailable ({e}), using the detail page alone")
+            break
+        return detail_html, promoter_html
+    
+    def scrape_project_details_selenium(self, project_url):
+        """Scrape details from a single project page in the browser"""
+        print(f"\nScraping project: {project_url}")
+        
+        try:
+            with REGISTRY.span('details_load'):
+                self.load_page(project_url)
+                self.wait_until('details_page', details_page_loaded)
+                detail_html = self.driver.page_source
             
             # Click on Promoter tab to get more information
+            promoter_html = None
             try:
-                promoter_tab = self.driver.find_element(By.XPATH, "//a[contains(text(),'Promoter') or contains(@href,'promoter')]")
-                self.driver.execute_script("arguments[0].click();", promoter_tab)
-                time.sleep(3)
-                print("Clicked Promoter tab")
-                
-                # Re-parse the page after clicking the tab
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                page_text = soup.get_text()
+                with REGISTRY.span('promoter_tab'):
+                    promoter_tab = self.driver.find_element(By.XPATH, PROMOTER_TAB_XPATH)
+                    self.driver.execute_script("arguments[0].click();", promoter_tab)
+                    self.wait_until('promoter_tab', promoter_panel_filled)
+                    print("Clicked Promoter tab")
+                    promoter_html = self.driver.page_source
             except:
                 print("Could not find or click Promoter tab")
             
-            # Extract Promoter Name
-            promoter_patterns = [
-                r'Company\s*Name\s*:?\s*([M/S\.\s]*[A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company\s*Logo|\s*Registration|\s*Correspondence|\s*Email|\n\s*\n|$)',
-                r'Promoter\s*Name\s*:?\s*([M/S\.\s]*[A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company|\s*Registration|\s*Email|\n\s*\n|$)',
-                r'Promoter\s*:?\s*([M/S\.\s]*[A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company|\s*Registration|\s*Email|\n\s*\n|$)',
-                r'M/S\.\s*([A-Z][A-Za-z0-9\s\.,&\-()]+?)(?=\s*Company|\s*Registration|\s*Email|\n\s*\n|$)'
-            ]
-            
-            for pattern in promoter_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    promoter_name = match.group(1).strip()
-                    promoter_name = re.sub(r'\s+', ' ', promoter_name)
-                    promoter_name = re.sub(r'Company Logo.*$', '', promoter_name, flags=re.IGNORECASE).strip()
-                    if len(promoter_name) > 3:
-                        project_data['Promoter Name'] = promoter_name
-                        print(f"Found Promoter Name: {promoter_name}")
-                        break
-            
-            # Extract Registered Office Address
-            address_patterns = [
-                r'Registered\s*Office\s*Address\s*:?\s*([A-Za-z0-9\s,\-\.:/()]+?)(?=\s*,{3,}|\s*Entity|\s*Email|\s*Mobile|\s*Phone|\n\s*\n|$)',
-                r'Office\s*Address\s*:?\s*([A-Za-z0-9\s,\-\.:/()]+?)(?=\s*,{3,}|\s*Entity|\s*Email|\s*Mobile|\s*Phone|\n\s*\n|$)',
-                r'Address\s*:?\s*([A-Za-z0-9\s,\-\.:/()]+?)(?=\s*,{3,}|\s*Entity|\s*Email|\s*Mobile|\s*Phone|\n\s*\n|$)'
-            ]
-            
-            for pattern in address_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    address = match.group(1).strip()
-                    address = re.sub(r'\s+', ' ', address)
-                    address = re.sub(r',+', ',', address)
-                    if len(address) > 10:
-                        project_data['Address of the Promoter'] = address
-                        print(f"Found Address: {address}")
-                        break
-            
-            # Extract GST Number
-            gst_patterns = [
-                r'GST\s*No\.?\s*:?\s*([A-Z0-9]{15})',
-                r'GSTIN\s*:?\s*([A-Z0-9]{15})',
-                r'GST\s*:?\s*([A-Z0-9]{15})',
-                r'([0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}[Z]{1}[0-9A-Z]{1})'
-            ]
-            
-            for pattern in gst_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    gst_no = match.group(1).strip()
-                    if len(gst_no) == 15:
-                        project_data['GST No'] = gst_no
-                        print(f"Found GST No: {gst_no}")
-                        break
-            
-            print(f"Final scraped data: {project_data}")
-            return project_data
+            return self.extract_project_data(detail_html, promoter_html, project_url)
             
         except Exception as e:
             print(f"Error scraping project details: {e}")
             import traceback
             traceback.print_exc()
-            return {
-                'Rera Regd. No': '',
-                'Project Name': '',
-                'Promoter Name': '',
-                'Address of the Promoter': '',
-                'GST No': ''
-            }
+            return empty_project_data()
+    
+    def extract_project_data(self, detail_html, promoter_html=None, project_url=None):
+        """Extract the project fields from raw page HTML with the shared extractor
+
+        When a cache is configured and project_url's pages are unchanged
+        since the last scrape, the cached row is returned instead.
+        """
+        if self.cache is not None and project_url:
+            cached = self.cache.lookup_row(project_url, detail_html, promoter_html)
+            if cached is not None:
+                print(f"Pages unchanged, reusing cached data: {cached}")
+                return cached
+        
+        project_data = self.extractor.extract(detail_html, promoter_html)
+        print(f"Final scraped data: {project_data}")
+        if self.cache is not None and project_url:
+            self.cache.put(project_url, detail_html, promoter_html, project_data)
+        return project_data
     
-    def scrape_all_projects(self, max_projects=6):
-        """Main method to scrape all projects"""
+    def reextract_cached(self):
+        """Re-run extraction over every cached page without fetching anything
+
+        Returns rows in the same shape as scrape_all_projects and stores
+        the new rows back into the cache.
+        """
+        all_projects_data = []
+        for project_url, detail_html, promoter_html in self.cache.iter_snapshots():
+            project_data = self.extractor.extract(detail_html, promoter_html)
+            self.cache.update_row(project_url, project_data)
+            project_data['URL'] = project_url
+            all_projects_data.append(project_data)
+        self.cache.save()
+        print(f"Re-extracted {len(all_projects_data)} cached projects")
+        return all_projects_data
+    
+    def scrape_all_projects(self, max_projects=6, workers=1, on_project=None):
+        """Main method to scrape all projects
+
+        With workers > 1 the detail pages are spread across a pool of
+        headless browsers; results still come back in listing order.
+        on_project(index, total, project_data) is called as each project
+        finishes, which may be out of order when running in parallel.
+        """
         print("Starting RERA Odisha project scraping...")
         
         # Get project links
-        project_links = self.get_project_links(max_projects)
+        with REGISTRY.span('link_discovery'):
+            project_links = self.get_project_links(max_projects)
         
         if not project_links:
             print("No project links found. The website structure might have changed.")
             return []
         
+        if workers > 1:
+            if self.browser_pool is not None:
+                # The workers lease from the same pool; holding our browser could leave one waiting forever
+                self.release_browser()
+            return scrape_projects_parallel(project_links, workers=workers, backend=self.backend,
+                                            headless=self.headless, cache=self.cache, on_project=on_project,
+                                            scheduler=self.scheduler, browser_pool=self.browser_pool)
+        
         # Scrape each project
         all_projects_data = []
         for i, project_url in enumerate(project_links, 1):
             print(f"\n--- Scraping Project {i}/{len(project_links)} ---")
-            project_data = self.scrape_project_details(project_url)
+            project_data = self.scrape_project_with_retries(project_url)
             project_data['URL'] = project_url
             all_projects_data.append(project_data)
-            
-            # Add delay between requests
-            time.sleep(2)
+            if on_project:
+                on_project(i, len(project_links), project_data)
         
+        print(f"\nPage readiness waits: {self.wait_summary()}")
+        print(f"Politeness scheduler: {self.scheduler.stats()}")
+        if self.cache is not None:
+            self.cache.save()
+            print(f"Snapshot cache: {self.cache.hits} unchanged, {self.cache.misses} re-extracted")
         return all_projects_data
     
     def save_to_csv(self, data, filename='rera_projects.csv'):
         """Save scraped data to CSV file"""
         if data:
+            # pandas is only needed for this export, so it is not imported with the scraper
+            import pandas as pd
             df = pd.DataFrame(data)
             df.to_csv(filename, index=False)
             print(f"\nData saved to {filename}")
@@ -369,22 +864,176 @@ class RERAOdishaScraper:
             print("No data to save")
             return None
     
+    def release_browser(self):
+        """Quit our own browser or hand a leased one back; the next page load starts or leases another"""
+        if self._lease is not None:
+            self.browser_pool.release(self._lease)
+            self._lease = None
+        elif self._owns_driver:
+            self._driver.quit()
+        else:
+            # An injected driver stays with this scraper
+            return
+        self._driver = None
+        self._owns_driver = False
+        self.pages_loaded = 0
+
     def close(self):
-        """Close the browser"""
-        self.driver.quit()
+        """Close (or hand back to its pool) the browser and any HTTP session this scraper created"""
+        self.release_browser()
+        self._driver = None
+        self.pages_loaded = 0
+        if self._owns_session:
+            self.session.close()
+
+
+class ScraperPool:
+    """A fixed set of worker threads, each driving its own RERAOdishaScraper
+
+    Each worker lazily starts its scraper the first time it picks up a
+    URL, so no more than `workers` browsers are ever running, and the
+    browsers are reused across map() calls until close().
+    With backend='http' the workers share one pooled session and only
+    start a browser for pages that need the Selenium fallback. All
+    workers fetch through one PolitenessScheduler, whose concurrency
+    limit is capped at `workers`. With a browser_pool, workers lease
+    their browsers from it and hand them back on close().
+    """
+
+    def __init__(self, workers=4, headless=True, backend='selenium', cache=None, scheduler=None,
+                 browser_pool=None):
+        self.workers = workers
+        self.headless = headless
+        self.backend = backend
+        self.cache = cache
+        self.browser_pool = browser_pool
+        self.scheduler = scheduler if scheduler is not None else PolitenessScheduler(max_concurrency=workers)
+        self.session = create_http_session(pool_size=workers) if backend == 'http' else None
+        self.local = threading.local()
+        self.scrapers = []
+        self.scrapers_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
 
-def main():
-    """Main function to run the scraper"""
+    def worker_scraper(self):
+        scraper = getattr(self.local, 'scraper', None)
+        if scraper is None:
+            scraper = RERAOdishaScraper(headless=self.headless, backend=self.backend, session=self.session,
+                                        cache=self.cache, scheduler=self.scheduler,
+                                        browser_pool=self.browser_pool)
+            self.local.scraper = scraper
+            with self.scrapers_lock:
+                self.scrapers.append(scraper)
+        return scraper
+
+    def scrape(self, project_url):
+        """Scrape one URL on the calling worker; failures give an empty record instead of raising"""
+        try:
+            project_data = self.worker_scraper().scrape_project_with_retries(project_url)
+        except Exception as e:
+            print(f"Worker failed on {project_url}: {e}")
+            project_data = empty_project_data()
+        project_data['URL'] = project_url
+        return project_data
+
+    def map(self, project_links, on_project=None):
+        """Scrape project_links across the workers, returning rows in the order of project_links"""
+        def scrape_one(index, project_url):
+            print(f"\n--- Scraping Project {index}/{len(project_links)} ---")
+            project_data = self.scrape(project_url)
+            if on_project:
+                on_project(index, len(project_links), project_data)
+            return project_data
+
+        return list(self.executor.map(scrape_one, range(1, len(project_links) + 1), project_links))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        for scraper in self.scrapers:
+            try:
+                scraper.close()
+            except Exception as e:
+                print(f"Error closing worker browser: {e}")
+        if self.session is not None:
+            self.session.close()
+        if self.cache is not None:
+            self.cache.save()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def scrape_projects_parallel(project_links, workers=4, headless=True, backend='selenium', cache=None,
+                             on_project=None, scheduler=None, browser_pool=None):
+    """Scrape project detail pages concurrently, one browser per worker thread
+
+    A failure on one URL yields an empty record for it instead of
+    stopping the run, and the returned list follows the order of
+    project_links.
+    """
+    print(f"Scraping {len(project_links)} projects with {workers} workers...")
+    with ScraperPool(workers=workers, headless=headless, backend=backend, cache=cache,
+                     scheduler=scheduler, browser_pool=browser_pool) as pool:
+        results = pool.map(project_links, on_project=on_project)
+    print(f"Politeness scheduler: {pool.scheduler.stats()}")
+    return results
+
+
+def main(max_projects=6, workers=1, backend='selenium', cache_dir=None, cache_ttl=DEFAULT_TTL, offline=False,
+         on_project=None, db_path=DEFAULT_DB_PATH, csv_file=None, report_file='scrape_report.json',
+         link_discovery='auto', max_rate=5.0, headless=True, browser_pool=None, raise_errors=False):
+    """Main function to run the scraper
+
+    Every project is upserted into the SQLite store at db_path as soon
+    as it is scraped; csv_file additionally writes a CSV at the end.
+    With cache_dir set, raw pages are kept in a SnapshotCache there and
+    unchanged projects reuse their previous row. offline=True skips the
+    site entirely and re-extracts every page already in the cache.
+    on_project is passed through to scrape_all_projects for progress
+    reporting. Phase timings and counters for this run are written to
+    report_file as JSON. Fetches are paced by a PolitenessScheduler that
+    never exceeds max_rate requests per second. Browsers are leased from
+    browser_pool when one is given (the Flask app keeps a warm pool),
+    otherwise started per run. Errors are printed and an empty or partial
+    result returned, unless raise_errors=True (used by background jobs,
+    which need to report the failure). Returns the scraped rows.
+    """
+    run_start = REGISTRY.snapshot()
     scraper = None
+    store = None
+    cache = None
+    projects_data = []
     try:
-        # Initialize scraper
-        scraper = RERAOdishaScraper()
+        store = ProjectStore(db_path)
+        
+        def record_project(index, total, project_data):
+            store.upsert(project_data)
+            if on_project:
+                on_project(index, total, project_data)
         
-        # Scrape first 6 projects
-        projects_data = scraper.scrape_all_projects(max_projects=6)
+        cache = SnapshotCache(cache_dir, ttl=cache_ttl) if cache_dir else None
+        if offline and cache is None:
+            raise ValueError("offline re-extraction needs a cache_dir")
         
-        # Save to CSV
-        csv_file = scraper.save_to_csv(projects_data)
+        # Initialize scraper (the http backend does not start Chrome until it is needed)
+        scheduler = PolitenessScheduler(max_rate=max_rate, max_concurrency=max(1, workers))
+        scraper = RERAOdishaScraper(headless=headless, backend='http' if offline else backend, cache=cache,
+                                    link_discovery=link_discovery, scheduler=scheduler, browser_pool=browser_pool)
+        
+        if offline:
+            projects_data = scraper.reextract_cached()
+            store.upsert_many(projects_data)
+        else:
+            # Scrape the first max_projects projects
+            projects_data = scraper.scrape_all_projects(max_projects=max_projects, workers=workers,
+                                                        on_project=record_project)
+        print(f"\n{store.count()} projects stored in {db_path}")
+        
+        # Optionally export to CSV
+        if csv_file:
+            scraper.save_to_csv(projects_data, csv_file)
         
         # Display results
         if projects_data:
@@ -407,10 +1056,43 @@ def main():
         print(f"An error occurred: {e}")
         import traceback
         traceback.print_exc()
+        if raise_errors:
+            raise
     
     finally:
         if scraper:
             scraper.close()
+        if store:
+            store.close()
+        if cache is not None:
+            # Persist what was fetched before an error or Ctrl-C
+            cache.save()
+        if report_file:
+            REGISTRY.write_report(report_file, since=run_start)
+    
+    return projects_data
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape projects from the Odisha RERA portal")
+    parser.add_argument('--max-projects', type=int, default=6, help="number of projects to scrape")
+    parser.add_argument('--workers', type=int, default=1, help="number of browser workers for detail pages")
+    parser.add_argument('--backend', choices=BACKENDS, default='selenium',
+                        help="fetch detail pages in Chrome or over plain HTTP with Selenium fallback")
+    parser.add_argument('--link-discovery', choices=LINK_DISCOVERY_MODES, default='auto',
+                        help="how project URLs are read from the listing (click-through is the fallback)")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite file projects are stored in")
+    parser.add_argument('--csv', help="also write the scraped projects to this CSV file")
+    parser.add_argument('--report', default='scrape_report.json', help="JSON file for the run's timing report")
+    parser.add_argument('--cache-dir', help="keep raw pages here and skip extraction for unchanged projects")
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_TTL, help="seconds before a cached page expires")
+    parser.add_argument('--offline', action='store_true', help="re-extract cached pages without visiting the site")
+    parser.add_argument('--max-rate', type=float, default=5.0, help="upper bound on requests per second to the site")
+    parser.add_argument('--show-browser', action='store_true', help="run Chrome with a visible window")
+    args = parser.parse_args()
+
+    main(max_projects=args.max_projects, workers=args.workers, backend=args.backend,
+         cache_dir=args.cache_dir, cache_ttl=args.cache_ttl, offline=args.offline,
+         db_path=args.db, csv_file=args.csv, report_file=args.report, link_discovery=args.link_discovery,
+         max_rate=args.max_rate, headless=not args.show_browser)
\ No newline at end of file
@@ -0,0 +1,156 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+DEFAULT_DB_PATH = 'rera_projects.db'
+
+# Row field -> column; the row field names match the CSV headers the app has always used
+COLUMNS = {
+    'Rera Regd. No': 'rera_no',
+    'Project Name': 'project_name',
+    'Promoter Name': 'promoter_name',
+    'Address of the Promoter': 'promoter_address',
+    'GST No': 'gst_no',
+    'URL': 'url',
+}
+EXPORT_FIELDS = list(COLUMNS) + ['Scraped At']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    rera_no TEXT PRIMARY KEY,
+    project_name TEXT NOT NULL DEFAULT '',
+    promoter_name TEXT NOT NULL DEFAULT '',
+    promoter_address TEXT NOT NULL DEFAULT '',
+    gst_no TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    first_seen_at REAL NOT NULL,
+    scraped_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_promoter ON projects(promoter_name);
+CREATE INDEX IF NOT EXISTS idx_projects_gst ON projects(gst_no);
+
+CREATE TABLE IF NOT EXISTS meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS projects_version_insert AFTER INSERT ON projects
+BEGIN UPDATE meta SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS projects_version_update AFTER UPDATE ON projects
+BEGIN UPDATE meta SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS projects_version_delete AFTER DELETE ON projects
+BEGIN UPDATE meta SET version = version + 1 WHERE id = 1; END;
+"""
+
+UPSERT_SQL = """
+INSERT INTO projects (rera_no, project_name, promoter_name, promoter_address, gst_no, url,
+                      first_seen_at, scraped_at)
+VALUES (:rera_no, :project_name, :promoter_name, :promoter_address, :gst_no, :url, :now, :now)
+ON CONFLICT(rera_no) DO UPDATE SET
+    project_name = excluded.project_name,
+    promoter_name = excluded.promoter_name,
+    promoter_address = excluded.promoter_address,
+    gst_no = excluded.gst_no,
+    url = excluded.url,
+    scraped_at = excluded.scraped_at
+"""
+
+SELECT_SQL = ("SELECT rera_no, project_name, promoter_name, promoter_address, gst_no, url, scraped_at "
+              "FROM projects")
+
+
+def _to_row(record):
+    row = {field: record[i] for i, field in enumerate(COLUMNS)}
+    row['Scraped At'] = datetime.fromtimestamp(record[-1], timezone.utc).isoformat(timespec='seconds')
+    return row
+
+
+class ProjectStore:
+    """SQLite storage for scraped projects, keyed by RERA registration number
+
+    Each project is upserted as soon as it is scraped. Promoter name and
+    GST number are indexed, and the meta.version counter is bumped by
+    triggers on every write so readers can cheaply tell when to refresh.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def upsert(self, project_data):
+        """Insert or update one project; returns False if it has no RERA number to key on"""
+        params = {column: (project_data.get(field) or '').strip() for field, column in COLUMNS.items()}
+        if not params['rera_no']:
+            print(f"Not storing project without a RERA number: {project_data.get('URL', '')}")
+            return False
+        params['now'] = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(UPSERT_SQL, params)
+        return True
+
+    def upsert_many(self, projects):
+        """Upsert several projects; returns how many were stored"""
+        return sum(1 for project_data in projects if self.upsert(project_data))
+
+    def version(self):
+        """Return a counter that changes whenever any project is written"""
+        with self.lock:
+            return self.conn.execute('SELECT version FROM meta WHERE id = 1').fetchone()[0]
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM projects').fetchone()[0]
+
+    def _query(self, where='', params=()):
+        with self.lock:
+            records = self.conn.execute(f"{SELECT_SQL} {where} ORDER BY rera_no", params).fetchall()
+        return [_to_row(record) for record in records]
+
+    def all_rows(self):
+        return self._query()
+
+    def by_promoter(self, promoter_name):
+        """All projects of one promoter (index seek on promoter_name)"""
+        return self._query('WHERE promoter_name = ?', (promoter_name,))
+
+    def by_gst(self, gst_no):
+        """All projects registered under one GST number (index seek on gst_no)"""
+        return self._query('WHERE gst_no = ?', (gst_no,))
+
+    def iter_rows(self, batch_size=500, promoter=None, gst_prefix=None):
+        """Yield projects in RERA number order, fetching batch_size rows at a time
+
+        promoter keeps one promoter's projects and gst_prefix keeps GST
+        numbers starting with that prefix. Only one batch is held in
+        memory at a time.
+        """
+        conditions = ['rera_no > ?']
+        filters = []
+        if promoter is not None:
+            conditions.append('promoter_name = ?')
+            filters.append(promoter)
+        if gst_prefix:
+            # A range rather than LIKE so the gst_no index can be used
+            conditions.append('gst_no >= ? AND gst_no < ?')
+            filters += [gst_prefix, gst_prefix + '\uffff']
+        sql = f"{SELECT_SQL} WHERE {' AND '.join(conditions)} ORDER BY rera_no LIMIT ?"
+
+        last_key = ''
+        while True:
+            with self.lock:
+                records = self.conn.execute(sql, [last_key, *filters, batch_size]).fetchall()
+            if not records:
+                return
+            for record in records:
+                yield _to_row(record)
+            last_key = records[-1][0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
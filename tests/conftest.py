@@ -0,0 +1,25 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# The modules live at the top of the repository rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Tests never start Chrome from the app's first-request warm-up
+os.environ.setdefault('WARM_BROWSERS', '0')
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    """The Flask app module with an empty ProjectStore of its own"""
+    # app opens its SQLite store in the working directory on import
+    monkeypatch.chdir(tmp_path)
+    module = sys.modules.get('app') or importlib.import_module('app')
+    from storage import ProjectStore
+    store = ProjectStore(str(tmp_path / 'projects.db'))
+    monkeypatch.setattr(module, 'store', store)
+    monkeypatch.setattr(module, 'data_cache', module.StoreDataCache(store))
+    yield module
+    store.close()
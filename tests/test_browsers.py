@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+import browsers
+from browsers import BrowserPool, chrome_options
+from extractor import PROJECT_FIELDS
+from politeness import PolitenessScheduler
+from scraper import RERAOdishaScraper
+
+
+class FakeDriver:
+    def __init__(self):
+        self.visited = []
+        self.quit_called = False
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def unthrottled():
+    return PolitenessScheduler(rate=1e6, max_rate=1e6, burst=1e6, max_concurrency=8)
+
+
+def fake_pool(monkeypatch, **kwargs):
+    monkeypatch.setattr(browsers, 'new_driver', lambda headless, block_resources: FakeDriver())
+    monkeypatch.setattr(browsers, 'browser_memory_mb', lambda driver: 100)
+    return BrowserPool(size=1, **kwargs)
+
+
+def test_browser_is_recycled_during_a_long_lease(monkeypatch):
+    pool = fake_pool(monkeypatch, max_pages=3)
+    scraper = RERAOdishaScraper(browser_pool=pool, scheduler=unthrottled())
+    first = scraper.driver
+    for i in range(5):
+        scraper.load_page(f'https://example.test/{i}')
+    assert first.quit_called
+    assert first.visited == [f'https://example.test/{i}' for i in range(3)]
+    assert scraper.driver is not first
+    assert scraper.driver.visited == ['https://example.test/3', 'https://example.test/4']
+    assert scraper.wait._driver is scraper.driver
+    assert pool.started == 1
+    scraper.close()
+    assert pool.idle.qsize() == 1
+
+
+def test_browser_over_memory_limit_is_recycled_mid_run(monkeypatch):
+    pool = fake_pool(monkeypatch, max_memory_mb=500, memory_check_every=2)
+    scraper = RERAOdishaScraper(browser_pool=pool, scheduler=unthrottled())
+    first = scraper.driver
+    scraper.load_page('https://example.test/0')
+    monkeypatch.setattr(browsers, 'browser_memory_mb', lambda driver: 800 if driver is first else 100)
+    scraper.load_page('https://example.test/1')
+    assert not first.quit_called
+    scraper.load_page('https://example.test/2')
+    assert first.quit_called
+    assert scraper.driver.visited == ['https://example.test/2']
+    scraper.close()
+
+
+def test_images_are_only_disabled_when_blocking_resources():
+    assert '--blink-settings=imagesEnabled=false' in chrome_options(block_resources=True).arguments
+    assert not any(arg.startswith('--blink-settings') for arg in chrome_options(block_resources=False).arguments)
+
+
+def test_parallel_scrape_does_not_starve_workers_of_a_shared_pool(monkeypatch):
+    pool = fake_pool(monkeypatch)
+    pool.size = 2
+
+    def fake_details(self, url):
+        self.load_page(url)
+        return {field: url for field in PROJECT_FIELDS}
+
+    monkeypatch.setattr(RERAOdishaScraper, 'scrape_project_details_selenium', fake_details)
+    scraper = RERAOdishaScraper(browser_pool=pool, scheduler=unthrottled())
+    urls = [f'https://example.test/{i}' for i in range(4)]
+    scraper.get_project_links = lambda max_projects: urls
+    results = []
+    thread = threading.Thread(target=lambda: results.extend(scraper.scrape_all_projects(workers=2)), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "scrape_all_projects blocked waiting for a browser"
+    assert [row['URL'] for row in results] == urls
+    scraper.close()
+    assert pool.started == pool.idle.qsize() == 2
+
+
+def test_acquire_gives_up_when_every_browser_is_leased(monkeypatch):
+    pool = fake_pool(monkeypatch)
+    pool.acquire()
+    with pytest.raises(RuntimeError, match="no browser was free"):
+        pool.acquire(timeout=0.01)
@@ -0,0 +1,90 @@
+import os
+import time
+
+from cache import SnapshotCache, content_hash
+
+
+def blobs(cache):
+    return sorted(name[:-len('.html')] for name in os.listdir(cache.blob_dir))
+
+
+def test_unchanged_pages_hit(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    assert cache.lookup_row('u1', '<p>a</p>', '<p>p</p>') is None
+    cache.put('u1', '<p>a</p>', '<p>p</p>', {'Project Name': 'A', 'URL': 'u1'})
+    assert cache.lookup_row('u1', '<p>a</p>', '<p>p</p>') == {'Project Name': 'A'}
+    assert cache.lookup_row('u1', '<p>changed</p>', '<p>p</p>') is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_replaced_blobs_are_deleted_once_unreferenced(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    cache.put('u1', 'detail-1', 'shared', {})
+    cache.put('u2', 'detail-2', 'shared', {})
+    cache.put('u1', 'detail-1b', 'shared', {})
+    # Unreferenced blobs stay until an index without them is on disk
+    assert content_hash('detail-1') in blobs(cache)
+    cache.save()
+    assert blobs(cache) == sorted(content_hash(html) for html in ('detail-1b', 'detail-2', 'shared'))
+    cache.put('u2', 'detail-2', None, {})
+    cache.put('u1', 'detail-1b', None, {})
+    cache.save()
+    assert content_hash('shared') not in blobs(cache)
+
+
+def test_unsaved_replacement_leaves_the_saved_index_readable(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    cache.put('u1', 'old detail', 'old promoter', {'Project Name': 'Old'})
+    cache.save()
+    # The process dies after replacing u1's pages but before the next save
+    cache.put('u1', 'new detail', 'new promoter', {'Project Name': 'New'})
+    cache.put('u2', 'unsaved', None, {})
+    reloaded = SnapshotCache(str(tmp_path))
+    assert list(reloaded.iter_snapshots()) == [('u1', 'old detail', 'old promoter')]
+    assert blobs(reloaded) == sorted(content_hash(html) for html in ('old detail', 'old promoter'))
+
+
+def test_entries_with_missing_blobs_are_skipped_on_load(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    cache.put('u1', 'one', None, {})
+    cache.put('u2', 'two', None, {})
+    cache.save()
+    os.remove(cache._blob_path(content_hash('one')))
+    reloaded = SnapshotCache(str(tmp_path))
+    assert [url for url, _, _ in reloaded.iter_snapshots()] == ['u2']
+
+
+def test_index_is_written_on_save_not_every_put(tmp_path):
+    cache = SnapshotCache(str(tmp_path), save_every=3)
+    cache.put('u1', 'a', None, {})
+    cache.put('u2', 'b', None, {})
+    assert not os.path.exists(cache.index_path)
+    cache.put('u3', 'c', None, {})
+    assert os.path.exists(cache.index_path)
+    cache.put('u4', 'd', None, {'Project Name': 'D'})
+    cache.save()
+    reloaded = SnapshotCache(str(tmp_path))
+    assert len(reloaded) == 4
+    assert reloaded.lookup_row('u4', 'd') == {'Project Name': 'D'}
+
+
+def test_eviction_drops_expired_and_least_recently_used(tmp_path):
+    cache = SnapshotCache(str(tmp_path), ttl=60, max_entries=2)
+    for url in ('u1', 'u2', 'u3'):
+        cache.put(url, f'page {url}', None, {})
+    cache.index['u1']['fetched_at'] = time.time() - 120
+    cache.index['u2']['accessed_at'] -= 10
+    cache.put('u4', 'page u4', None, {})
+    cache.save()
+    assert sorted(cache.index) == ['u3', 'u4']
+    assert blobs(cache) == sorted(content_hash(f'page {url}') for url in ('u3', 'u4'))
+
+
+def test_many_puts_stay_cheap(tmp_path):
+    cache = SnapshotCache(str(tmp_path), max_entries=None)
+    start = time.perf_counter()
+    for i in range(3000):
+        cache.put(f'u{i}', f'detail {i}', f'promoter {i % 50}', {'Project Name': str(i)})
+    cache.save()
+    assert time.perf_counter() - start < 10
+    assert len(SnapshotCache(str(tmp_path))) == 3000
@@ -0,0 +1,141 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import crawl
+from crawl import RegistryCrawler
+from politeness import PolitenessScheduler
+
+
+class FakeScraper:
+    backend = 'http'
+    cache = None
+    browser_pool = None
+
+    def __init__(self, pages):
+        self.scheduler = PolitenessScheduler()
+        self.pages = pages
+        self.requested = []
+
+    def get_listing_page_links(self, page, district=None):
+        self.requested.append(page)
+        return self.pages(page) if callable(self.pages) else self.pages.get(page, [])
+
+
+class FakePool:
+    """Stands in for ScraperPool: 'scrapes' URLs on worker threads from a URL -> RERA number map"""
+
+    def __init__(self, rera_numbers):
+        self.rera_numbers = rera_numbers
+        self.scraped = []
+
+    def __call__(self, **kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def map(self, project_links, on_project=None):
+        self.scraped.extend(project_links)
+
+        def scrape(index, url):
+            project_data = {'Rera Regd. No': self.rera_numbers[url], 'URL': url}
+            on_project(index, len(project_links), project_data)
+            return project_data
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return list(executor.map(scrape, range(1, len(project_links) + 1), project_links))
+
+
+class FakeStore:
+    def __init__(self):
+        self.rows = []
+        self.lock = threading.Lock()
+
+    def upsert(self, project_data):
+        with self.lock:
+            self.rows.append(project_data)
+        return True
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return str(tmp_path / 'checkpoint.json')
+
+
+def make_crawler(monkeypatch, pages, rera_numbers, checkpoint, **kwargs):
+    pool = FakePool(rera_numbers)
+    monkeypatch.setattr(crawl, 'ScraperPool', pool)
+    crawler = RegistryCrawler(FakeScraper(pages), FakeStore(), checkpoint_path=checkpoint, **kwargs)
+    return crawler, pool
+
+
+def test_concurrent_checkpoint_saves(monkeypatch, checkpoint):
+    crawler, _ = make_crawler(monkeypatch, {}, {}, checkpoint)
+    crawler.seen_urls = {f'u{i}' for i in range(200)}
+
+    def save_many():
+        for _ in range(50):
+            crawler.save_checkpoint()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(save_many) for _ in range(4)]:
+            future.result()
+    with open(checkpoint, encoding='utf-8') as f:
+        assert len(json.load(f)['seen_urls']) == 200
+
+
+def test_duplicate_rera_numbers_are_stored_once(monkeypatch, checkpoint):
+    pages = {1: ['a', 'b'], 2: ['c']}
+    crawler, _ = make_crawler(monkeypatch, pages, {'a': 'R1', 'b': 'R2', 'c': 'R1'}, checkpoint)
+    assert crawler.run() == 2
+    assert crawler.duplicates == 1
+    assert sorted(row['URL'] for row in crawler.store.rows) == ['a', 'b']
+
+
+def test_resume_skips_past_a_fully_crawled_page(monkeypatch, checkpoint):
+    with open(checkpoint, 'w', encoding='utf-8') as f:
+        json.dump({'frontier': [[None, 1]], 'seen_urls': ['a', 'b'], 'seen_rera': ['R1', 'R2']}, f)
+    pages = {1: ['a', 'b'], 2: ['c'], 3: ['d']}
+    crawler, pool = make_crawler(monkeypatch, pages, {'c': 'R3', 'd': 'R4'}, checkpoint)
+    crawler.run()
+    assert pool.scraped == ['c', 'd']
+    with open(checkpoint, encoding='utf-8') as f:
+        assert json.load(f)['frontier'] == []
+
+
+def test_ignored_page_parameter_ends_the_district(monkeypatch, checkpoint):
+    crawler, pool = make_crawler(monkeypatch, lambda page: ['a', 'b'], {'a': 'R1', 'b': 'R2'}, checkpoint)
+    crawler.run()
+    assert crawler.scraper.requested == [1, 2]
+    assert pool.scraped == ['a', 'b']
+
+
+def test_max_pages(monkeypatch, checkpoint):
+    pages = {1: ['a'], 2: ['b'], 3: ['c']}
+    crawler, pool = make_crawler(monkeypatch, pages, {'a': 'R1', 'b': 'R2', 'c': 'R3'}, checkpoint, max_pages=2)
+    crawler.run()
+    assert pool.scraped == ['a', 'b']
+
+
+def test_checkpoint_is_saved_every_few_projects_and_each_page(monkeypatch, checkpoint):
+    pages = {1: [f'p1-{i}' for i in range(7)], 2: ['p2-0']}
+    rera_numbers = {url: f'R-{url}' for urls in pages.values() for url in urls}
+    crawler, _ = make_crawler(monkeypatch, pages, rera_numbers, checkpoint, checkpoint_every=3,
+                              checkpoint_interval=3600)
+    saves = []
+    save_checkpoint = crawler.save_checkpoint
+    monkeypatch.setattr(crawler, 'save_checkpoint', lambda: saves.append(len(crawler.seen_urls)) or save_checkpoint())
+    crawler.run()
+    # Two saves inside page 1, one after each of the three listing pages
+    assert len(saves) == 5
+    assert saves[-1] == 8
+    with open(checkpoint, encoding='utf-8') as f:
+        state = json.load(f)
+    assert sorted(state['seen_urls']) == sorted(rera_numbers)
+    assert state['frontier'] == []
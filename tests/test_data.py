@@ -0,0 +1,89 @@
+import pytest
+
+
+def project(n, promoter='Acme Builders', gst='21AAAA0000'):
+    return {
+        'Rera Regd. No': f'RP/{n:04d}',
+        'Project Name': f'Tower {n}',
+        'Promoter Name': promoter,
+        'Address of the Promoter': f'{n} Main Road',
+        'GST No': gst,
+        'URL': f'https://example.test/project/{n}',
+    }
+
+
+@pytest.fixture
+def client(app_module):
+    app_module.store.upsert_many([project(1), project(2, promoter='Other Homes', gst='21BBBB0002'),
+                                  project(3), project(4)])
+    return app_module.app.test_client()
+
+
+def rera_numbers(response):
+    return [row['Rera Regd. No'] for row in response.get_json()]
+
+
+def test_all_rows(client):
+    response = client.get('/data')
+    assert response.status_code == 200
+    assert rera_numbers(response) == ['RP/0001', 'RP/0002', 'RP/0003', 'RP/0004']
+    assert response.headers['X-Total-Count'] == '4'
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+def test_limit_offset_and_columns(client):
+    response = client.get('/data?limit=2&offset=1')
+    assert rera_numbers(response) == ['RP/0002', 'RP/0003']
+    assert response.headers['X-Total-Count'] == '4'
+    assert rera_numbers(client.get('/data?offset=3')) == ['RP/0004']
+    assert client.get('/data?limit=0').get_json() == []
+    response = client.get('/data?limit=1&columns=Project Name, GST No')
+    assert response.get_json() == [{'Project Name': 'Tower 1', 'GST No': '21AAAA0000'}]
+
+
+def test_promoter_and_gst_lookups(client):
+    assert rera_numbers(client.get('/data?promoter=Other Homes')) == ['RP/0002']
+    response = client.get('/data?gst=21AAAA0000&limit=1')
+    assert rera_numbers(response) == ['RP/0001']
+    assert response.headers['X-Total-Count'] == '3'
+
+
+@pytest.mark.parametrize('query', ['limit=ten', 'offset=1.5', 'limit=-1', 'offset=-2'])
+def test_bad_paging_is_rejected(client, query):
+    response = client.get(f'/data?{query}')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_unchanged_data_gets_304(client):
+    first = client.get('/data?limit=2')
+    etag = first.headers['ETag']
+    again = client.get('/data?limit=2', headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.headers['ETag'] == etag
+    assert again.data == b''
+    # Another query over the same data has its own ETag
+    other = client.get('/data?limit=3', headers={'If-None-Match': etag})
+    assert other.status_code == 200
+    assert other.headers['ETag'] != etag
+
+
+def test_etag_changes_after_a_write(app_module, client):
+    etag = client.get('/data').headers['ETag']
+    app_module.store.upsert(project(5))
+    response = client.get('/data', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.headers['X-Total-Count'] == '5'
+
+
+def test_rows_are_reloaded_only_after_a_write(app_module, client, monkeypatch):
+    client.get('/data')
+    reads = []
+    all_rows = app_module.store.all_rows
+    monkeypatch.setattr(app_module.store, 'all_rows', lambda: reads.append(1) or all_rows())
+    client.get('/data')
+    assert reads == []
+    app_module.store.upsert(project(1, promoter='Renamed'))
+    assert client.get('/data?limit=1').get_json()[0]['Promoter Name'] == 'Renamed'
+    assert reads == [1]
@@ -0,0 +1,116 @@
+import csv
+import gzip
+import io
+import json
+
+import pyarrow.parquet as pq
+import pytest
+
+import exports
+from exports import iter_parquet
+from storage import EXPORT_FIELDS
+
+
+def project(n, promoter='Acme Builders', gst=None):
+    return {
+        'Rera Regd. No': f'RP/{n:04d}',
+        'Project Name': f'Tower {n}',
+        'Promoter Name': promoter,
+        'Address of the Promoter': f'{n} Main Road, Bhubaneswar',
+        'GST No': gst if gst is not None else f'21AAAC{n:04d}',
+        'URL': f'https://example.test/project/{n}',
+    }
+
+
+@pytest.fixture
+def client(app_module):
+    app_module.store.upsert_many([project(1, gst='21AAAA0001'), project(2, promoter='Other Homes', gst='21BBBB0002'),
+                                  project(3, gst='21AAAB0003'), project(4, gst='')])
+    return app_module.app.test_client()
+
+
+def rera_numbers(rows):
+    return [row['Rera Regd. No'] for row in rows]
+
+
+def test_csv_download(client):
+    response = client.get('/download')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    assert 'rera_projects.csv' in response.headers['Content-Disposition']
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert rera_numbers(rows) == ['RP/0001', 'RP/0002', 'RP/0003', 'RP/0004']
+    assert list(rows[0]) == EXPORT_FIELDS
+    assert rows[1]['Promoter Name'] == 'Other Homes'
+
+
+def test_ndjson_download(client):
+    response = client.get('/download?format=ndjson')
+    assert response.mimetype == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert rera_numbers(rows) == ['RP/0001', 'RP/0002', 'RP/0003', 'RP/0004']
+    assert rows[0]['Project Name'] == 'Tower 1'
+
+
+def test_parquet_download(client):
+    response = client.get('/download?format=parquet')
+    assert response.mimetype == 'application/vnd.apache.parquet'
+    assert 'Content-Encoding' not in response.headers
+    table = pq.read_table(io.BytesIO(response.data))
+    assert table.column_names == EXPORT_FIELDS
+    assert rera_numbers(table.to_pylist()) == ['RP/0001', 'RP/0002', 'RP/0003', 'RP/0004']
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'ndjson'])
+def test_text_downloads_are_gzipped_on_request(client, fmt):
+    plain = client.get(f'/download?format={fmt}').data
+    response = client.get(f'/download?format={fmt}', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(response.data) == plain
+
+
+def test_download_filters(client):
+    by_promoter = client.get('/download?format=ndjson&promoter=Acme Builders').get_data(as_text=True)
+    assert rera_numbers(map(json.loads, by_promoter.splitlines())) == ['RP/0001', 'RP/0003', 'RP/0004']
+    by_gst = client.get('/download?format=ndjson&gst_prefix=21AAA').get_data(as_text=True)
+    assert rera_numbers(map(json.loads, by_gst.splitlines())) == ['RP/0001', 'RP/0003']
+    both = client.get('/download?format=ndjson&promoter=Other Homes&gst_prefix=21AAA').get_data(as_text=True)
+    assert both == ''
+
+
+def test_unknown_format_is_rejected(client):
+    response = client.get('/download?format=xlsx')
+    assert response.status_code == 400
+    assert 'xlsx' in response.get_json()['error']
+
+
+def test_rows_are_read_in_batches(app_module):
+    store = app_module.store
+    store.upsert_many(project(n, gst=f'21AAAA{n:04d}') for n in range(1, 8))
+    assert rera_numbers(store.iter_rows(batch_size=3)) == [f'RP/{n:04d}' for n in range(1, 8)]
+    assert rera_numbers(store.iter_rows(batch_size=2, gst_prefix='21AAAA000')) == \
+        [f'RP/{n:04d}' for n in range(1, 8)]
+    assert list(store.iter_rows(batch_size=2, promoter='Nobody')) == []
+
+
+def test_large_exports_stream_in_several_chunks(app_module, monkeypatch):
+    monkeypatch.setattr(exports, 'CHUNK_SIZE', 256)
+    app_module.store.upsert_many(project(n) for n in range(1, 41))
+    client = app_module.app.test_client()
+    for fmt in ('csv', 'ndjson'):
+        response = client.get(f'/download?format={fmt}', buffered=False)
+        chunks = list(response.response)
+        assert len(chunks) > 2
+        text = ''.join(chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in chunks)
+        assert text.count('RP/00') == 40
+
+
+def test_parquet_is_written_one_row_group_at_a_time():
+    rows = [project(n) for n in range(1, 8)]
+    chunks = list(iter_parquet(rows, EXPORT_FIELDS, row_group_size=3))
+    # Two full row groups are flushed as they fill, then the last group and the footer
+    assert len(chunks) == 3 and all(chunks)
+    parquet_file = pq.ParquetFile(io.BytesIO(b''.join(chunks)))
+    assert parquet_file.metadata.num_row_groups == 3
+    assert rera_numbers(parquet_file.read().to_pylist()) == [f'RP/{n:04d}' for n in range(1, 8)]
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from jobs import JobManager
+
+
+def wait_for(job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not job.closed:
+        assert time.monotonic() < deadline, f"job still {job.status}"
+        time.sleep(0.01)
+
+
+def failing_target(on_project=None):
+    raise RuntimeError("Chrome failed to start")
+
+
+def test_failing_target_marks_job_failed():
+    jobs = JobManager(failing_target)
+    job, created = jobs.submit()
+    wait_for(job)
+    assert created
+    assert job.status == 'failed'
+    assert job.error == "Chrome failed to start"
+    assert job.events[-1]['type'] == 'failed'
+
+
+def test_run_scraper_reraises(app_module, monkeypatch):
+    import scraper
+    calls = []
+    monkeypatch.setattr(scraper, 'main', lambda **params: calls.append(params))
+    app_module.run_scraper(on_project=None)
+    assert calls[0]['raise_errors'] is True
+
+
+def test_events_report_failure_and_tolerate_bad_last_event_id(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, 'jobs', JobManager(failing_target))
+    client = app_module.app.test_client()
+    job_id = client.post('/scrape').get_json()['job_id']
+    wait_for(app_module.jobs.get(job_id))
+    response = client.get(f'/jobs/{job_id}/events', headers={'Last-Event-ID': 'not-a-number'})
+    assert response.status_code == 200
+    assert b'event: failed' in response.data
+    assert client.get(f'/jobs/{job_id}').get_json()['status'] == 'failed'
+
+
+def test_first_request_warms_browser_pool_once(app_module, monkeypatch):
+    warmed = []
+    monkeypatch.setenv('WARM_BROWSERS', '1')
+    monkeypatch.setattr(app_module.browsers, 'warm', lambda: warmed.append(True))
+    monkeypatch.setattr(app_module, 'warm_started', app_module.threading.Event())
+    client = app_module.app.test_client()
+    client.get('/')
+    client.get('/')
+    deadline = time.monotonic() + 5
+    while not warmed:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert warmed == [True]
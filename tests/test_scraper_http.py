@@ -0,0 +1,98 @@
+import os
+
+import pytest
+import requests
+
+import scraper as scraper_module
+from extractor import PROJECT_FIELDS
+from politeness import PolitenessScheduler
+from scraper import RERAOdishaScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'fixtures')
+
+
+def response(status, text='<html></html>', url='https://example.test/project/1'):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = text.encode()
+    resp.url = url
+    return resp
+
+
+class FakeSession:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    delays = []
+    monkeypatch.setattr(scraper_module, 'backoff_delay', lambda attempt: 0.0)
+    monkeypatch.setattr(scraper_module.time, 'sleep', delays.append)
+    return delays
+
+
+def http_scraper(session, retries=2):
+    scraper = RERAOdishaScraper(backend='http', session=session, retries=retries,
+                                scheduler=PolitenessScheduler(rate=1e6, max_rate=1e6, min_rate=1e6, burst=1e6))
+    scraper.selenium_urls = []
+
+    def selenium(url):
+        scraper.selenium_urls.append(url)
+        return {field: 'from browser' for field in PROJECT_FIELDS}
+
+    scraper.scrape_project_details_selenium = selenium
+    return scraper
+
+
+@pytest.mark.parametrize('failure', [response(503), response(429), requests.Timeout("read timed out"),
+                                     requests.ConnectionError("refused")])
+def test_failed_fetch_is_retried_without_selenium(no_backoff, failure):
+    session = FakeSession(failure)
+    scraper = http_scraper(session)
+    project_data = scraper.scrape_project_with_retries('https://example.test/project/1')
+    assert scraper.selenium_urls == []
+    assert session.calls == 3
+    assert len(no_backoff) == 2
+    assert not any(project_data.values())
+
+
+def test_fetch_recovers_after_server_error(no_backoff):
+    session = FakeSession(response(503), response(200))
+    scraper = http_scraper(session)
+    project_data = scraper.scrape_project_with_retries('https://example.test/project/1')
+    # The page came back without the required fields, so only then is the browser used
+    assert scraper.selenium_urls == ['https://example.test/project/1']
+    assert project_data['Project Name'] == 'from browser'
+    assert len(no_backoff) == 1
+
+
+def test_missing_page_is_not_retried(no_backoff):
+    session = FakeSession(response(404))
+    scraper = http_scraper(session)
+    project_data = scraper.scrape_project_with_retries('https://example.test/project/1')
+    assert session.calls == 1
+    assert no_backoff == []
+    assert scraper.selenium_urls == []
+    assert not any(project_data.values())
+
+
+def test_missing_promoter_page_keeps_the_detail_page(no_backoff):
+    # Recorded detail page 101 links to a separate /promoter/101 page
+    with open(os.path.join(FIXTURES_DIR, 'details', '101.html'), encoding='utf-8') as f:
+        detail = f.read()
+    session = FakeSession(response(200, detail), response(404, url='https://example.test/promoter/101'))
+    scraper = http_scraper(session)
+    project_data = scraper.scrape_project_with_retries('https://example.test/project/101')
+    assert session.calls == 2
+    assert no_backoff == []
+    assert project_data['Rera Regd. No'] == 'RP/01/2024/01101'
+    assert project_data['Project Name'] == 'SAI SHRADHA ENCLAVE'
@@ -0,0 +1,103 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+from politeness import PolitenessScheduler
+from scraper import RERAOdishaScraper, extract_detail_links
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+from standin import FIXTURES_DIR, StandInSite  # noqa: E402
+
+# A listing whose links are relative, Angular router links, or repeated
+ROUTER_LISTING = """<html><body>
+<div class="card"><a href="../project-details/104">View</a></div>
+<div class="card"><button routerlink="/project-details/102">View</button></div>
+<div class="card"><a ng-reflect-router-link="project-details/999" href="#">View</a></div>
+<div class="card"><a href="/project-details/104">View again</a></div>
+<a href="/about">About</a>
+</body></html>"""
+
+
+@pytest.fixture(scope='module')
+def site(tmp_path_factory):
+    fixtures_dir = str(tmp_path_factory.mktemp('standin') / 'fixtures')
+    shutil.copytree(FIXTURES_DIR, fixtures_dir)
+    with open(os.path.join(fixtures_dir, 'project-list-3.html'), 'w', encoding='utf-8') as f:
+        f.write(ROUTER_LISTING)
+    with StandInSite(fixtures_dir) as site:
+        yield site
+
+
+@pytest.fixture
+def scraper(site):
+    scraper = RERAOdishaScraper(backend='http', listing_url=site.listing_url,
+                                scheduler=PolitenessScheduler(rate=1e6, max_rate=1e6, burst=1e6))
+    scraper.fetched = []
+    http_get = scraper.http_get
+
+    def recording_get(url):
+        scraper.fetched.append(url[len(site.base_url):])
+        return http_get(url)
+
+    def no_browser(url):
+        raise AssertionError(f"{url} fell back to Selenium")
+
+    scraper.http_get = recording_get
+    scraper.scrape_project_details_selenium = no_browser
+    yield scraper
+    scraper.close()
+
+
+def paths(site, urls):
+    return [url[len(site.base_url):] for url in urls]
+
+
+def test_listing_pages_over_http(site, scraper):
+    assert paths(site, scraper.discover_links_http(10)) == [
+        '/project-details/101', '/project-details/102', '/project-details/103']
+    assert paths(site, scraper.discover_links_http(10, page=2)) == ['/project-details/103', '/project-details/104']
+    assert paths(site, scraper.discover_links_http(2)) == ['/project-details/101', '/project-details/102']
+    assert scraper.fetched[1] == '/projects/project-list?page=2'
+
+
+def test_relative_and_router_links_are_resolved(site, scraper):
+    assert paths(site, scraper.discover_links_http(10, page=3)) == [
+        '/project-details/104', '/project-details/102', '/projects/project-details/999']
+
+
+def test_extract_detail_links_against_a_base_url():
+    base = 'https://rera.odisha.gov.in/projects/project-list?page=3'
+    assert extract_detail_links(ROUTER_LISTING, base) == [
+        'https://rera.odisha.gov.in/project-details/104',
+        'https://rera.odisha.gov.in/project-details/102',
+        'https://rera.odisha.gov.in/projects/project-details/999',
+    ]
+
+
+def test_separate_promoter_page_is_followed(site, scraper):
+    project_data = scraper.scrape_project_details(f'{site.base_url}/project-details/101')
+    assert scraper.fetched == ['/project-details/101', '/promoter/101']
+    assert project_data == {
+        'Rera Regd. No': 'RP/01/2024/01101',
+        'Project Name': 'SAI SHRADHA ENCLAVE',
+        'Promoter Name': 'M/S. SAI SHRADHA BUILDERS PRIVATE LIMITED',
+        'Address of the Promoter': 'Plot No 1123, Jaydev Vihar, Bhubaneswar, Khordha, Odisha 751013',
+        'GST No': '21AAKCS1234F1Z5',
+    }
+
+
+def test_in_page_promoter_tab_needs_no_second_fetch(site, scraper):
+    # Fixture 102 has its promoter panel on the detail page and no /promoter/102
+    project_data = scraper.scrape_project_details(f'{site.base_url}/project-details/102')
+    assert scraper.fetched == ['/project-details/102']
+    assert project_data['Promoter Name'] == 'M/S. NILACHAL HOMES LLP'
+    assert project_data['GST No'] == '21AAQFN5678K1ZP'
+
+
+def test_every_recorded_project_scrapes_over_http(site, scraper):
+    rows = [scraper.scrape_project_details(url) for url in site.detail_urls()]
+    assert all(all(row.values()) for row in rows)
+    assert [row['Rera Regd. No'] for row in rows] == [
+        'RP/01/2024/01101', 'RP/19/2023/00987', 'RP/30/2024/01245', 'RP/01/2024/01101']
@@ -0,0 +1,80 @@
+import sqlite3
+
+import pytest
+
+from storage import ProjectStore
+
+
+def project(rera_no='RP/0001', name='Tower 1', promoter='Acme Builders', gst='21AAAA0001'):
+    return {
+        'Rera Regd. No': rera_no,
+        'Project Name': name,
+        'Promoter Name': promoter,
+        'Address of the Promoter': 'Main Road',
+        'GST No': gst,
+        'URL': f'https://example.test/{rera_no}',
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProjectStore(str(tmp_path / 'projects.db'))
+    yield store
+    store.close()
+
+
+def first_seen(store, rera_no):
+    return store.conn.execute('SELECT first_seen_at, scraped_at FROM projects WHERE rera_no = ?',
+                              (rera_no,)).fetchone()
+
+
+def test_update_keeps_first_seen_at(store, monkeypatch):
+    monkeypatch.setattr('storage.time.time', lambda: 1000.0)
+    assert store.upsert(project(name='Tower 1'))
+    monkeypatch.setattr('storage.time.time', lambda: 2000.0)
+    assert store.upsert(project(name=' Tower One '))
+    assert store.count() == 1
+    assert first_seen(store, 'RP/0001') == (1000.0, 2000.0)
+    row = store.all_rows()[0]
+    assert row['Project Name'] == 'Tower One'
+    assert row['Scraped At'] == '1970-01-01T00:33:20+00:00'
+
+
+def test_rows_without_rera_number_are_skipped(store):
+    assert not store.upsert(project(rera_no=''))
+    assert not store.upsert(project(rera_no='   '))
+    assert store.upsert_many([project(rera_no=''), project(rera_no='RP/0002')]) == 1
+    assert [row['Rera Regd. No'] for row in store.all_rows()] == ['RP/0002']
+
+
+def test_version_changes_with_writes_from_another_connection(store):
+    other = ProjectStore(store.path)
+    before = store.version()
+    other.upsert(project())
+    after_insert = store.version()
+    assert after_insert > before
+    other.upsert(project(name='Renamed'))
+    assert store.version() > after_insert
+    # Deletes made outside the store (e.g. by hand in sqlite3) are seen too
+    after_update = store.version()
+    with sqlite3.connect(store.path) as conn:
+        conn.execute('DELETE FROM projects')
+    assert store.version() > after_update
+    other.close()
+
+
+def test_lookups_by_promoter_and_gst(store):
+    store.upsert_many([project('RP/0002', promoter='Acme Builders', gst='21AAAA0001'),
+                       project('RP/0001', promoter='Acme Builders', gst='21BBBB0002'),
+                       project('RP/0003', promoter='Other Homes', gst='21AAAA0001')])
+    assert [row['Rera Regd. No'] for row in store.by_promoter('Acme Builders')] == ['RP/0001', 'RP/0002']
+    assert [row['Rera Regd. No'] for row in store.by_gst('21AAAA0001')] == ['RP/0002', 'RP/0003']
+    assert store.by_promoter('acme builders') == []
+    assert store.by_gst('21AAAA') == []
+
+
+@pytest.mark.parametrize('column, index', [('promoter_name', 'idx_projects_promoter'),
+                                           ('gst_no', 'idx_projects_gst')])
+def test_lookups_use_their_index(store, column, index):
+    plan = store.conn.execute(f'EXPLAIN QUERY PLAN SELECT * FROM projects WHERE {column} = ?', ('x',)).fetchall()
+    assert any(index in str(step) for step in plan)
@@ -0,0 +1,161 @@
+import time
+
+import pytest
+
+import workqueue
+from workqueue import WorkQueue, coordinate
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), lease_seconds=60, max_attempts=2, retry_delay=0)
+    yield queue
+    queue.close()
+
+
+def expire_leases(queue):
+    queue.conn.execute("UPDATE work_items SET lease_expires = ? WHERE state = 'leased'", (time.time() - 1,))
+
+
+def test_enqueue_ignores_queued_urls(queue):
+    assert queue.enqueue(['a', 'b']) == 2
+    assert queue.enqueue(['b', 'c']) == 1
+    assert queue.counts() == {'pending': 3}
+
+
+def test_leased_urls_are_not_handed_out_twice(queue):
+    queue.enqueue(['a', 'b'])
+    assert queue.lease('w1') == ['a']
+    assert queue.lease('w2') == ['b']
+    assert queue.lease('w3') == []
+
+
+def test_expired_lease_is_redelivered_and_late_result_dropped(queue):
+    queue.enqueue(['a'])
+    assert queue.lease('dead') == ['a']
+    expire_leases(queue)
+    assert queue.lease('w2') == ['a']
+    assert queue.complete('dead', 'a', {'Rera Regd. No': 'R1'}) == 'stale'
+    assert queue.complete('w2', 'a', {'Rera Regd. No': 'R1'}) == 'done'
+    store = FakeStore()
+    assert queue.collect(store) == 1
+    assert queue.collect(store) == 0
+    assert store.projects == [{'Rera Regd. No': 'R1'}]
+
+
+def test_extend_keeps_a_live_lease(queue):
+    queue.enqueue(['a'])
+    queue.lease('w1')
+    expire_leases(queue)
+    assert queue.extend('w1', 'a')
+    assert queue.lease('w2') == []
+    assert not queue.extend('w2', 'a')
+
+
+def test_lease_gives_up_after_max_attempts(queue):
+    queue.enqueue(['a'])
+    for worker in ('w1', 'w2'):
+        assert queue.lease(worker) == ['a']
+        expire_leases(queue)
+    assert queue.lease('w3') == []
+    assert queue.counts() == {'failed': 1}
+
+
+def test_failed_scrape_is_retried_then_marked_failed(queue):
+    queue.enqueue(['a'])
+    queue.lease('w1')
+    queue.fail('w1', 'a', 'timeout')
+    assert queue.lease('w2') == ['a']
+    queue.fail('w2', 'a', 'timeout')
+    assert queue.counts() == {'failed': 1}
+
+
+def test_failed_url_waits_out_its_backoff(tmp_path, monkeypatch):
+    monkeypatch.setattr(workqueue, 'backoff_delay', lambda attempt, base: base * attempt)
+    queue = WorkQueue(str(tmp_path / 'queue.db'), max_attempts=3, retry_delay=60)
+    queue.enqueue(['a'])
+    queue.lease('w1')
+    queue.fail('w1', 'a', '503 Service Unavailable')
+    assert queue.lease('w2') == []
+    assert queue.counts() == {'pending': 1}
+    queue.conn.execute("UPDATE work_items SET not_before = ?", (time.time() - 1,))
+    assert queue.lease('w2') == ['a']
+    queue.close()
+
+
+def test_duplicate_rera_number_is_rejected(queue):
+    queue.enqueue(['a', 'b'])
+    queue.lease('w1', count=2)
+    assert queue.complete('w1', 'a', {'Rera Regd. No': 'R1'}) == 'done'
+    assert queue.complete('w1', 'b', {'Rera Regd. No': ' R1 '}) == 'duplicate'
+    assert queue.counts() == {'done': 1, 'duplicate': 1}
+    store = FakeStore()
+    queue.collect(store)
+    assert [row['Rera Regd. No'] for row in store.projects] == ['R1']
+
+
+def test_results_stay_uncollected_until_stored(queue):
+    queue.enqueue(['a'])
+    queue.lease('w1')
+    queue.complete('w1', 'a', {'Rera Regd. No': 'R1'})
+    with pytest.raises(OSError):
+        queue.collect(FailingStore())
+    store = FakeStore()
+    assert queue.collect(store) == 1
+    assert store.projects == [{'Rera Regd. No': 'R1'}]
+
+
+class FakeScraper:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get_listing_page_links(self, page, district=None):
+        return self.pages.get(page, [])
+
+
+class FakeStore:
+    def __init__(self):
+        self.projects = []
+
+    def upsert_many(self, projects):
+        self.projects.extend(projects)
+        return len(projects)
+
+
+class FailingStore:
+    def upsert_many(self, projects):
+        raise OSError("database is locked")
+
+
+def test_restarted_coordinator_continues_discovery(queue):
+    # A previous coordinator got as far as page 1 before it died
+    queue.enqueue(['a', 'b'])
+    pages = {1: ['a', 'b'], 2: ['c'], 3: ['c']}
+    queue.lease('w1', count=3)
+    for url in ('a', 'b'):
+        queue.complete('w1', url, {'Rera Regd. No': url})
+
+    def finish_page_two():
+        urls = queue.lease('w1', count=3)
+        for url in urls:
+            queue.complete('w1', url, {'Rera Regd. No': url})
+
+    scraper = FakeScraper(pages)
+    original = queue.seal
+
+    def seal():
+        original()
+        finish_page_two()
+
+    queue.seal = seal
+    assert coordinate(queue, scraper, FakeStore(), poll_interval=0) == 3
+    assert queue.sealed()
+    assert queue.counts() == {'done': 3}
+
+
+def test_unretryable_failure_is_final(queue):
+    queue.enqueue(['a'])
+    queue.lease('w1')
+    queue.fail('w1', 'a', '404 Client Error', retry=False)
+    assert queue.lease('w2') == []
+    assert queue.counts() == {'failed': 1}
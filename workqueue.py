@@ -0,0 +1,341 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from metrics import REGISTRY
+from politeness import backoff_delay
+from storage import DEFAULT_DB_PATH, ProjectStore
+
+DEFAULT_QUEUE_PATH = 'work_queue.db'
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+# Base of the jittered exponential delay before a failed URL is leased again
+DEFAULT_RETRY_DELAY = 10.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    url TEXT PRIMARY KEY,
+    state TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    not_before REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    rera_no TEXT,
+    result TEXT,
+    error TEXT,
+    collected INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_work_items_state ON work_items(state, lease_expires);
+
+CREATE TABLE IF NOT EXISTS rera_claims (
+    rera_no TEXT PRIMARY KEY,
+    url TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS queue_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    sealed INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO queue_meta (id, sealed) VALUES (1, 0);
+"""
+
+
+class WorkQueue:
+    """Project URLs shared between a coordinator and any number of workers
+
+    A SQLite file stands in for a networked queue: every process opens the
+    same path. The file uses SQLite's rollback journal rather than WAL,
+    since WAL needs shared memory and only works for processes on one
+    host; the directory holding it must support POSIX file locks.
+
+    Workers lease URLs for lease_seconds; a lease that is not completed
+    in time (the worker died or hung) expires and the URL is handed to
+    the next worker, up to max_attempts times. A URL given back with
+    fail() is not leased again until a jittered exponential delay (based
+    on retry_delay seconds) has passed. A result is accepted only from
+    the worker still holding the lease, and a project whose RERA number
+    was already claimed by another URL is recorded as a duplicate
+    instead of a result.
+
+    Once the coordinator has enqueued everything it calls seal(), which
+    tells idle workers they can exit when nothing is left.
+    """
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH, lease_seconds=DEFAULT_LEASE_SECONDS,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, retry_delay=DEFAULT_RETRY_DELAY):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lock = threading.Lock()
+        # Autocommit mode so leases can take the write lock up front with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=DELETE')
+        self.conn.executescript(SCHEMA)
+
+    def _transaction(self, func, *args):
+        with self.lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = func(*args)
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+            self.conn.execute('COMMIT')
+            return result
+
+    def enqueue(self, urls):
+        """Add URLs that are not queued yet; returns how many were new"""
+        def insert():
+            now = time.time()
+            before = self.conn.total_changes
+            self.conn.executemany('INSERT OR IGNORE INTO work_items (url, enqueued_at) VALUES (?, ?)',
+                                  [(url, now) for url in urls])
+            return self.conn.total_changes - before
+        return self._transaction(insert)
+
+    def seal(self):
+        """Mark the queue as complete: no more URLs will be enqueued"""
+        self._transaction(lambda: self.conn.execute('UPDATE queue_meta SET sealed = 1 WHERE id = 1'))
+
+    def sealed(self):
+        with self.lock:
+            return bool(self.conn.execute('SELECT sealed FROM queue_meta WHERE id = 1').fetchone()[0])
+
+    def lease(self, worker_id, count=1):
+        """Lease up to count URLs to worker_id, including ones whose previous lease expired"""
+        def take():
+            now = time.time()
+            # Expired leases that used up their attempts are given up on rather than redelivered
+            self.conn.execute("UPDATE work_items SET state = 'failed', lease_owner = NULL, finished_at = ? "
+                              "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                              (now, now, self.max_attempts))
+            records = self.conn.execute(
+                "SELECT url, state FROM work_items "
+                "WHERE (state = 'pending' AND (not_before IS NULL OR not_before <= ?)) "
+                "OR (state = 'leased' AND lease_expires < ?) ORDER BY enqueued_at LIMIT ?",
+                (now, now, count)).fetchall()
+            for url, state in records:
+                if state == 'leased':
+                    REGISTRY.inc('scraper_lease_redeliveries_total')
+                self.conn.execute("UPDATE work_items SET state = 'leased', lease_owner = ?, lease_expires = ?, "
+                                  "attempts = attempts + 1 WHERE url = ?",
+                                  (worker_id, now + self.lease_seconds, url))
+            return [url for url, _ in records]
+        return self._transaction(take)
+
+    def extend(self, worker_id, url):
+        """Push back the expiry of a lease still held by worker_id; returns False if it was lost"""
+        def renew():
+            cursor = self.conn.execute("UPDATE work_items SET lease_expires = ? "
+                                       "WHERE url = ? AND state = 'leased' AND lease_owner = ?",
+                                       (time.time() + self.lease_seconds, url, worker_id))
+            return cursor.rowcount == 1
+        return self._transaction(renew)
+
+    def complete(self, worker_id, url, project_data):
+        """Record a scraped project
+
+        Returns 'done', 'duplicate' when another URL already has this RERA
+        number, or 'stale' when worker_id no longer holds the lease (the
+        URL was redelivered and the result is dropped).
+        """
+        rera_no = (project_data.get('Rera Regd. No') or '').strip()
+
+        def finish():
+            owner = self.conn.execute("SELECT lease_owner FROM work_items WHERE url = ? AND state = 'leased'",
+                                      (url,)).fetchone()
+            if owner is None or owner[0] != worker_id:
+                return 'stale'
+            self.conn.execute('INSERT OR IGNORE INTO rera_claims (rera_no, url) VALUES (?, ?)', (rera_no, url))
+            claimed_by = self.conn.execute('SELECT url FROM rera_claims WHERE rera_no = ?', (rera_no,)).fetchone()[0]
+            state = 'done' if claimed_by == url else 'duplicate'
+            self.conn.execute("UPDATE work_items SET state = ?, lease_owner = NULL, rera_no = ?, result = ?, "
+                              "finished_at = ? WHERE url = ?",
+                              (state, rera_no, json.dumps(project_data) if state == 'done' else None,
+                               time.time(), url))
+            return state
+
+        outcome = self._transaction(finish)
+        if outcome == 'duplicate':
+            REGISTRY.inc('scraper_duplicates_total')
+        elif outcome == 'stale':
+            REGISTRY.inc('scraper_stale_results_total')
+        return outcome
+
+    def fail(self, worker_id, url, error, retry=True):
+        """Give a URL back after a failed scrape; it is retried after a backoff until max_attempts
+
+        With retry=False (e.g. the page returned 404) it is marked failed
+        at once.
+        """
+        def release():
+            record = self.conn.execute("SELECT attempts FROM work_items "
+                                       "WHERE url = ? AND state = 'leased' AND lease_owner = ?",
+                                       (url, worker_id)).fetchone()
+            if record is None:
+                return
+            now = time.time()
+            state = 'failed' if not retry or record[0] >= self.max_attempts else 'pending'
+            self.conn.execute("UPDATE work_items SET state = ?, lease_owner = NULL, error = ?, finished_at = ?, "
+                              "not_before = ? WHERE url = ?",
+                              (state, str(error), now, now + backoff_delay(record[0], base=self.retry_delay), url))
+        self._transaction(release)
+
+    def collect(self, store):
+        """Upsert completed projects not collected before into store; returns how many were stored
+
+        Rows are marked collected only after the store has them, so a
+        coordinator that dies in between collects them again on restart
+        (upserts are keyed on the RERA number, so that is harmless).
+        """
+        with self.lock:
+            records = self.conn.execute("SELECT url, result FROM work_items "
+                                        "WHERE state = 'done' AND collected = 0").fetchall()
+        if not records:
+            return 0
+        stored = store.upsert_many([json.loads(result) for _, result in records])
+        self._transaction(lambda: self.conn.executemany('UPDATE work_items SET collected = 1 WHERE url = ?',
+                                                        [(url,) for url, _ in records]))
+        return stored
+
+    def counts(self):
+        """Number of URLs in each state"""
+        with self.lock:
+            return dict(self.conn.execute('SELECT state, COUNT(*) FROM work_items GROUP BY state').fetchall())
+
+    def outstanding(self):
+        """URLs that are still pending or leased"""
+        counts = self.counts()
+        return counts.get('pending', 0) + counts.get('leased', 0)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def coordinate(queue, scraper, store, max_pages=None, districts=None, poll_interval=5.0):
+    """Fill the queue from the listing, then move finished projects into store until the queue drains
+
+    A district ends on an empty page (or one repeating the page before
+    it), not on a page whose URLs are already queued, so a restarted
+    coordinator walks past what it enqueued before and carries on.
+    """
+    for district in districts or [None]:
+        page = 1
+        previous_links = None
+        while max_pages is None or page <= max_pages:
+            label = f"{district} page {page}" if district else f"page {page}"
+            with REGISTRY.span('crawl_page', detail=label):
+                project_links = list(dict.fromkeys(scraper.get_listing_page_links(page, district)))
+            if not project_links or project_links == previous_links:
+                break
+            added = queue.enqueue(project_links)
+            print(f"Listing {label}: {len(project_links)} links, {added} new")
+            previous_links = project_links
+            page += 1
+    queue.seal()
+    print(f"Queue sealed: {queue.counts()}")
+
+    stored = 0
+    while True:
+        stored += queue.collect(store)
+        if not queue.outstanding():
+            break
+        print(f"Waiting for workers: {queue.counts()}, {stored} stored")
+        time.sleep(poll_interval)
+    stored += queue.collect(store)
+    print(f"Queue drained: {queue.counts()}, {stored} stored")
+    return stored
+
+
+def work(queue, scraper, worker_id=None, batch_size=1, poll_interval=5.0):
+    """Lease and scrape URLs until the queue is sealed and empty; returns how many were completed"""
+    from scraper import is_retryable
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+    while True:
+        urls = queue.lease(worker_id, batch_size)
+        if not urls:
+            if queue.sealed() and not queue.outstanding():
+                print(f"Worker {worker_id}: queue is empty, exiting after {completed} projects")
+                return completed
+            time.sleep(poll_interval)
+            continue
+        for url in urls:
+            # A batch may outlive the lease of its last URLs; renew before starting each one
+            if not queue.extend(worker_id, url):
+                print(f"Lease on {url} lost, skipping")
+                continue
+            try:
+                project_data = scraper.scrape_project_details(url)
+                project_data['URL'] = url
+            except Exception as e:
+                print(f"Worker {worker_id} failed on {url}: {e}")
+                queue.fail(worker_id, url, e, retry=is_retryable(e))
+                continue
+            if not project_data['Rera Regd. No']:
+                queue.fail(worker_id, url, "no RERA number scraped")
+                continue
+            outcome = queue.complete(worker_id, url, project_data)
+            print(f"{url}: {outcome}")
+            completed += outcome == 'done'
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from cache import SnapshotCache
+    from scraper import BACKENDS, LINK_DISCOVERY_MODES, RERAOdishaScraper
+
+    parser = argparse.ArgumentParser(description="Scrape the registry with one coordinator and many workers")
+    parser.add_argument('role', choices=('coordinator', 'worker'))
+    parser.add_argument('--queue', default=DEFAULT_QUEUE_PATH, help="SQLite file shared by all processes")
+    parser.add_argument('--lease', type=int, default=DEFAULT_LEASE_SECONDS,
+                        help="seconds before an unfinished URL is redelivered")
+    parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help="deliveries of a URL before it is marked failed")
+    parser.add_argument('--retry-delay', type=float, default=DEFAULT_RETRY_DELAY,
+                        help="base seconds of the jittered backoff before a failed URL is retried")
+    parser.add_argument('--backend', choices=BACKENDS, default='selenium',
+                        help="fetch pages in Chrome or over plain HTTP with Selenium fallback")
+    parser.add_argument('--link-discovery', choices=LINK_DISCOVERY_MODES, default='auto',
+                        help="how the coordinator reads project URLs from the listing")
+    parser.add_argument('--districts', help="comma-separated districts for the coordinator to enqueue")
+    parser.add_argument('--max-pages', type=int, help="listing pages per district to enqueue")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite file the coordinator stores projects in")
+    parser.add_argument('--worker-id', help="name of this worker (defaults to host-pid)")
+    parser.add_argument('--batch', type=int, default=1, help="URLs a worker leases at a time")
+    parser.add_argument('--cache-dir', help="keep raw pages here and skip extraction for unchanged projects")
+    parser.add_argument('--listing-url', help="listing page to start from (defaults to the live portal)")
+    args = parser.parse_args()
+
+    queue = WorkQueue(args.queue, lease_seconds=args.lease, max_attempts=args.max_attempts,
+                      retry_delay=args.retry_delay)
+    kwargs = {'listing_url': args.listing_url} if args.listing_url else {}
+    scraper = RERAOdishaScraper(backend=args.backend, link_discovery=args.link_discovery,
+                                cache=SnapshotCache(args.cache_dir) if args.cache_dir else None, **kwargs)
+    try:
+        if args.role == 'coordinator':
+            store = ProjectStore(args.db)
+            try:
+                districts = [name.strip() for name in args.districts.split(',')] if args.districts else None
+                coordinate(queue, scraper, store, max_pages=args.max_pages, districts=districts)
+            finally:
+                store.close()
+        else:
+            work(queue, scraper, worker_id=args.worker_id, batch_size=args.batch)
+    finally:
+        scraper.close()
+        if scraper.cache is not None:
+            scraper.cache.save()
+        queue.close()